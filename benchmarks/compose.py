@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Frootlab
+#
+# This file is part of Frootlab Hup, https://www.frootlab.org/hup
+#
+#  Hup is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  Hup is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with
+#  Hup. If not, see <http://www.gnu.org/licenses/>.
+#
+"""Benchmark for the composition of operators.
+
+Compares the evaluation time of deep operator chains, which are composed by
+nested functions, with the flat compositions, that are created by the function
+:func:`hup.base.operator.compose`. Usage: python -m benchmarks.compose
+
+"""
+
+__copyright__ = '2019 Frootlab'
+__license__ = 'GPLv3'
+__docformat__ = 'google'
+__author__ = 'Frootlab Developers'
+__email__ = 'contact@frootlab.org'
+__authors__ = ['Patrick Michl <patrick.michl@frootlab.org>']
+
+import functools
+import operator
+import timeit
+from typing import Any, Callable, List, Tuple
+from hup.base import operator as hop
+
+AnyOp = Callable[..., Any]
+
+#
+# Reference Implementation
+#
+
+def compose_nested(*args: AnyOp, unpack: bool = False) -> AnyOp:
+    """Compose operators by nested functions."""
+    circ: AnyOp
+    if unpack:
+        circ = lambda f, g: lambda *cargs: f(*g(*cargs))
+    else:
+        circ = lambda f, g: lambda *cargs: f(g(*cargs))
+    return functools.reduce(circ, args)
+
+#
+# Benchmark Cases
+#
+
+def create_cases(depth: int) -> List[Tuple[str, tuple, bool, tuple]]:
+    """Create chains of given depth and suitable arguments."""
+    obj: Any = 1
+    for _ in range(depth):
+        obj = [obj]
+    items = tuple(operator.itemgetter(0) for _ in range(depth))
+    attrs = tuple(operator.attrgetter('real') for _ in range(depth))
+    swap = hop.Getter('y', 'x', domain=(None, ('x', 'y')))
+    swaps = tuple(swap for _ in range(depth))
+    return [
+        ('itemgetter', items, False, (obj, )),
+        ('attrgetter', attrs, False, (1, )),
+        ('Getter', swaps, True, (1, 2))]
+
+def run(depths: Tuple[int, ...] = (2, 8, 32), number: int = 100000) -> None:
+    """Run the benchmark and print the evaluation times."""
+    print(f"{'chain':<12} {'depth':>5} {'nested [s]':>11} {'flat [s]':>9}")
+    for depth in depths:
+        for name, ops, unpack, args in create_cases(depth):
+            nested = compose_nested(*ops, unpack=unpack)
+            flat = hop.compose(*ops, unpack=unpack)
+            assert nested(*args) == flat(*args)
+            t_nested = timeit.timeit(lambda: nested(*args), number=number)
+            t_flat = timeit.timeit(lambda: flat(*args), number=number)
+            print(f"{name:<12} {depth:>5} {t_nested:>11.4f} {t_flat:>9.4f}")
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 Frootlab
+#
+# This file is part of Frootlab Hup, https://www.frootlab.org/hup
+#
+#  Hup is free software: you can redistribute it and/or modify it under the
+#  terms of the GNU General Public License as published by the Free Software
+#  Foundation, either version 3 of the License, or (at your option) any later
+#  version.
+#
+#  Hup is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR
+#  A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#  You should have received a copy of the GNU General Public License along with
+#  Hup. If not, see <http://www.gnu.org/licenses/>.
+#
+"""Benchmark for the creation of operators.
+
+Measures the time and the memory, which is required for the creation of
+distinct operators. Thereby the operators are created with distinct arguments,
+such that the instances are not taken from the registry of the operator
+classes. Usage: python -m benchmarks.creation
+
+"""
+
+__copyright__ = '2019 Frootlab'
+__license__ = 'GPLv3'
+__docformat__ = 'google'
+__author__ = 'Frootlab Developers'
+__email__ = 'contact@frootlab.org'
+__authors__ = ['Patrick Michl <patrick.michl@frootlab.org>']
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+from hup.base import operator as hop
+
+AnyOp = Callable[..., Any]
+
+def create_cases() -> List[Tuple[str, AnyOp]]:
+    """Create functions, that create the i-th operator of a given class."""
+    return [
+        ('Getter', lambda i: hop.Getter(
+            f'x{i}', 'y', domain=(dict, (f'x{i}', 'y', 'z')))),
+        ('Lambda', lambda i: hop.Lambda(f'x * {i} + y')),
+        ('Vector', lambda i: hop.Vector(
+            'a', ('b', f'a + {i}', ('a', )), domain=dict))]
+
+def clear() -> None:
+    """Clear the registries of the operator classes."""
+    for cls in (hop.Zero, hop.Identity, hop.Getter, hop.Lambda, hop.Vector):
+        cls.clear_registry()
+    gc.collect()
+
+def run(number: int = 2000) -> None:
+    """Run the benchmark and print the creation time and memory."""
+    print(f"{'operator':<10} {'time [us]':>10} {'memory [kB]':>12}")
+    for name, create in create_cases():
+        clear()
+        start = time.perf_counter()
+        ops = [create(i) for i in range(number)]
+        elapsed = time.perf_counter() - start
+        del ops
+        clear()
+        tracemalloc.start()
+        ops = [create(i) for i in range(number)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{name:<10} {elapsed / number * 1e6:>10.1f} "
+            f"{size / number / 1024:>12.2f}")
+
+if __name__ == '__main__':
+    run()
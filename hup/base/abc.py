@@ -24,8 +24,9 @@ __author__ = 'Frootlab Developers'
 __email__ = 'contact@frootlab.org'
 __authors__ = ['Patrick Michl <patrick.michl@frootlab.org>']
 
+import collections
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Any, Dict, Tuple, Optional
+from typing import Any, Dict, List, NamedTuple, Tuple, Optional
 
 #
 # Creational Patterns
@@ -103,6 +104,13 @@ class Singleton(metaclass=SingletonMeta):
     """
     __slots__: list = []
 
+class RegistryInfo(NamedTuple):
+    """Statistics of the instance registry of a Multiton class."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
 class MultitonMeta(IsolatedMeta):
     """Metaclass for Multitons.
 
@@ -114,8 +122,25 @@ class MultitonMeta(IsolatedMeta):
     configurations, caching and collections of constants (given as immutable
     objects).
 
+    The instances of any Multiton class are kept within a separate registry,
+    which by default is unbounded. For long running applications, that create
+    many distinct instances, the size of the registry can be limited by
+    :meth:`set_registry_maxsize`. In this case the least recently used instances
+    are discarded from the registry, if the maximum size is exceeded.
+
+    Instances of Multiton classes record the class and the arguments of their
+    creation. Thereby Multitons are pickled by their creation arguments and
+    recreated, when they are unpickled.
+
+    Multiton classes, which set the class attribute '_isolated' to False, are
+    not isolated. In this case the instances are created without a new
+    subclass, which reduces the time and the memory of their creation.
+
     """
-    _registry: Dict[Tuple[type, tuple, Any], object] = {}
+    _registries: Dict[type, 'collections.OrderedDict[Any, object]'] = {}
+    _counts: Dict[type, List[int]] = {}
+    _registry_maxsize: Optional[int] = None
+    _isolated: bool = True
 
     def __call__(cls, *args: Any, **kwds: Any) -> object:
         # Create 'fingerprint' of instance. Beware: The fingerprint is only
@@ -123,10 +148,14 @@ class MultitonMeta(IsolatedMeta):
         # Check registry for the fingerprint. If the fingerprint is not hashable
         # create and return and an instance of the class. If the the fingerprint
         # could not not be found in the registry, create a class instance, add
-        # it to the registry and return the instance.
+        # it to the registry and return the instance. Thereby registry hits
+        # are moved to the end of the registry, such that the registry is
+        # ordered from the least to the most recently used instance.
+        registry = cls._get_registry()
+        counts = cls._counts[cls]
         try:
-            key = (cls, args, frozenset(kwds.items()))
-            return cls._registry[key]
+            key = (args, frozenset(kwds.items()))
+            obj = registry[key]
         except TypeError as err:
             if 'unhashable' in str(err):
                 register = False
@@ -134,36 +163,130 @@ class MultitonMeta(IsolatedMeta):
                 raise
         except KeyError:
             register = True
-
-        # Create new subclass of the given class. Set the attribute '__slots__'
-        # to an empty list, to allow the usage of slots.
-        subcls = MultitonMeta(cls.__name__, (cls, ), {'__slots__': []})
-
-        # Create an instance of the class. Note, that if the class does not
-        # implement an __init__ method a TypeError is raised. In this case the
-        # class is called without arguments.
+        else:
+            registry.move_to_end(key)
+            counts[0] += 1
+            return obj
+        counts[1] += 1
+
+        # Create an instance of the class. If the class is isolated, the
+        # instance is created within a new subclass of the class. Note, that if
+        # the class does not implement an __init__ method a TypeError is raised.
+        # In this case the class is called without arguments.
+        if cls._isolated:
+            create = super(MultitonMeta, cls).__call__
+        else:
+            create = super(IsolatedMeta, cls).__call__
         try:
-            obj = super(MultitonMeta, cls).__call__(*args, **kwds)
+            obj = create(*args, **kwds)
         except TypeError as err:
             if 'takes no arguments' in str(err):
-                obj = super(MultitonMeta, cls).__call__()
+                obj = create()
             else:
                 raise
 
+        # Record the class and the arguments of the creation. Note: If the
+        # __new__ method of the class returns an instance of another Multiton
+        # class, the instance already has recorded its own arguments, which
+        # are kept.
+        if not hasattr(obj, '_multiton_args'):
+            try:
+                setattr(obj, '_multiton_args', (cls, args, kwds))
+            except AttributeError:
+                pass
+
         # If the fingerprint is hashable, add the instance to the registry and
-        # finally return it.
+        # discard the least recently used instances, if the registry exceeds
+        # its maximum size. Finally return the instance.
         if register:
-            cls._registry[key] = obj
+            registry[key] = obj
+            cls._shrink_registry()
         return obj
 
+    def get_registry_info(cls) -> RegistryInfo:
+        """Get statistics of the instance registry of the class.
+
+        Returns:
+            Named tuple with the number of registry hits and misses, the maximum
+            size of the registry and the current number of registered instances.
+
+        """
+        registry = cls._get_registry()
+        hits, misses = cls._counts[cls]
+        return RegistryInfo(hits, misses, cls._registry_maxsize, len(registry))
+
+    def set_registry_maxsize(cls, maxsize: Optional[int]) -> None:
+        """Set the maximum number of registered instances of the class.
+
+        Args:
+            maxsize: Positive integer, which gives the maximum number of
+                instances, that are kept within the registry of the class. If
+                the maximum size is exceeded, the least recently used instances
+                are discarded from the registry. If maxsize is None, the size of
+                the registry is unbounded. The maximum size is inherited by
+                subclasses, which do not set their own maximum size.
+
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(
+                f"'maxsize' is required to be a positive integer or None, "
+                f"not {maxsize}")
+        cls._registry_maxsize = maxsize
+
+        # Shrink the registries of the class and of all subclasses, which
+        # inherit the maximum size
+        for subcls in list(cls._registries):
+            if issubclass(subcls, cls):
+                subcls._shrink_registry()
+
+    def clear_registry(cls) -> None:
+        """Discard all registered instances and reset the registry statistics.
+
+        Instances, that already have been created and are referenced elsewhere,
+        remain valid, but are not returned by subsequent calls of the class.
+
+        """
+        cls._get_registry().clear()
+        cls._counts[cls] = [0, 0]
+
+    def _get_registry(cls) -> 'collections.OrderedDict[Any, object]':
+        registry = cls._registries.get(cls)
+        if registry is None:
+            registry = collections.OrderedDict()
+            cls._registries[cls] = registry
+            cls._counts[cls] = [0, 0]
+        return registry
+
+    def _shrink_registry(cls) -> None:
+        maxsize = cls._registry_maxsize
+        if maxsize is None:
+            return
+        registry = cls._get_registry()
+        while len(registry) > maxsize:
+            registry.popitem(last=False)
+
 class Multiton(metaclass=MultitonMeta):
     """Abstract Base Class for Multiton Classes.
 
     The Multiton base class is a helper class, which is included to allow
-    instance checking against the MultitonMeta metaclass.
+    instance checking against the MultitonMeta metaclass. Furthermore it
+    provides the pickling of Multitons by their creation arguments.
 
     """
-    __slots__: list = []
+    __slots__: list = ['_multiton_args']
+
+    _multiton_args: Tuple[type, tuple, Dict[str, Any]]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        try:
+            cls, args, kwds = self._multiton_args
+        except AttributeError:
+            return super().__reduce__()
+        return _create_multiton, (cls, args, kwds)
+
+def _create_multiton(
+        cls: MultitonMeta, args: tuple, kwds: Dict[str, Any]) -> object:
+    return cls(*args, **kwds)
 
 def sentinel(cls: SingletonMeta) -> object:
     """Class decorator that creates a Sentinel from a Singleton class.
@@ -172,6 +172,27 @@ def search_old(module: Optional[Module] = None, **kwds: Any) -> dict:
     # Search for algorithms
     return pkg.search(module=module, rules=rules, **kwds)
 
+#
+# Builtin Categories
+#
+
+@category
+class Statistic:
+    """Catalog category for sample statistics.
+
+    Sample statistics are measures of some attribute of the individual columns
+    of a sample, e.g. the arithmetic mean values or the number of distinct
+    values.
+
+    Args:
+        name: Name of the statistic
+        tags: Optional tuple of strings, that describe the statistic and allow
+            it to be found by browsing or searching
+
+    """
+    name: str
+    tags: tuple = ()
+
 #
 # Operator Decorators
 #
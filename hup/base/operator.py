@@ -24,21 +24,60 @@ __author__ = 'Frootlab Developers'
 __email__ = 'contact@frootlab.org'
 __authors__ = ['Patrick Michl <patrick.michl@frootlab.org>']
 
+import array
+import ast
+import asyncio
+import bisect
 import collections
+import concurrent.futures
+import contextlib
 import functools
+import hashlib
+import heapq
 import itertools
+import math
 import operator
-from typing import Any, Hashable, List, Optional, Tuple, Sequence, Union
-from hup.base import abc, parser, stype
+import os
+import pickle
+import random
+import tempfile
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Generator
+from typing import Hashable, IO, Iterable, Iterator, List, NamedTuple
+from typing import Optional, Sequence, Tuple, Union
+from hup.base import abc, catalog, parser, stype
 from hup.errors import InvalidTypeError
 from hup.typing import check
-from hup.typing import Method, Mapping, NoneType, OptOp, SeqHom
-from hup.typing import SeqOp, AnyOp, StrList, StrTuple
+from hup.typing import Method, Mapping, NaN, NoneType, OptOp, SeqHom
+from hup.typing import SeqOp, AnyOp, AsyncSeqOp, StrList, StrTuple
 from hup.base.stype import FieldID, Frame
 
 Key = Optional[Union[FieldID, Frame]]
 Item = Tuple[FieldID, Any]
 
+# Typecodes of field types, that are stored in typed arrays by columnar
+# evaluations
+_TYPECODES = {int: 'q', float: 'd'}
+
+# Number of objects, that are processed as a block by filters and that are
+# pickled as a block into the runs of external sorts
+_BLOCK_SIZE = 1024
+
+# Number of objects, that are sent as a single task to worker processes
+_TASK_SIZE = 16384
+
+# Number of partitions, into which the partial aggregates of hashed group
+# aggregations are spilled, and the maximum depth of recursive partitioning
+_SPILL_PARTITIONS = 16
+_SPILL_DEPTH = 4
+
+# Sentinel for exhausted iterators
+_MISSING = object()
+
+# File mode creation mask of the process, which is read once at import, since
+# it can only be read by temporarily replacing it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 #
 # Operator Classes
 #
@@ -52,28 +91,63 @@ class Operator(collections.abc.Callable, abc.Multiton): # type: ignore
         target:
 
     """
-    __slots__: StrList = ['_domain', '_target']
+    __slots__: StrList = ['_domain', '_target', '__call__']
 
     _domain: stype.Domain
     _target: stype.Domain
 
+    # Operators are not isolated by their Multiton base class. Instead the
+    # built function of an operator is bound to the slot '__call__', which is
+    # called like a method of the class.
+    _isolated = False
+
     def __init__(
             self, *args: FieldID, domain: stype.DomLike = None,
             target: stype.DomLike = None) -> None:
         self._domain = stype.create_domain(domain, defaults={'fields': args})
         self._target = stype.create_domain(target, defaults={'fields': args})
 
-        # If a target frame is given, build a len function and bind it to the
-        # method __call__. Note: This is only possible, since the Multiton base
-        # class isolates classes per instances.
-        if self._target.frame:
-            size = len(self._target.frame)
-            func: AnyOp = lambda: size
-            meth = staticmethod(func)
-            setattr(type(self), '__len__', meth)
+    def __bool__(self) -> bool:
+        return True
 
-    def __call__(self, *args: Any) -> Any:
-        raise NotImplementedError() # TODO
+    def __len__(self) -> int:
+        # The length of an operator is given by the size of its target frame
+        frame = self.target.frame
+        if not frame:
+            raise TypeError(
+                f"object of type '{type(self).__name__}' has no len()")
+        return len(frame)
+
+    def batch(self, seq: Sequence[Any], typed: bool = True) -> Any:
+        """Evaluate the operator for a sequence of objects.
+
+        Args:
+            seq: Sequence of objects within the domain of the operator. If the
+                domain type is NoneType and the domain frame does not comprise
+                exactly one field, the objects are required to be tuples, that
+                contain the positional arguments of the operator.
+            typed: Optional boolean parameter. If set to False, all columns are
+                given as lists. By default the columns of numeric fields are
+                given as typed arrays.
+
+        Returns:
+            Column-major representation of the results. If the target frame
+            comprises a single field and the target type is NoneType, or if no
+            target frame is given, then a single column is returned. Otherwise
+            the columns are represented by an object of the target type, which
+            is a tuple, a list or a dictionary, that uses the target frame as
+            keys. Columns of fields, that are typed :class:`int` or
+            :class:`float` within the target basis are given as typed arrays
+            (see :mod:`array`), unless their values can not be stored in a
+            typed array. All other columns are given as lists.
+
+        """
+        dom = self.domain
+        if dom.type == NoneType and len(dom.frame) != 1:
+            rows = list(itertools.starmap(self, seq))
+        else:
+            rows = list(map(self, seq))
+        return _get_columns(rows, target=self.target, typed=typed)
 
     @property
     def domain(self) -> stype.Domain:
@@ -112,6 +186,9 @@ class Zero(Operator):
         self._validate()
         self._build()
 
+    def __bool__(self) -> bool:
+        return False
+
     def __len__(self) -> int:
         return 0
 
@@ -136,12 +213,10 @@ class Zero(Operator):
 
     def _build(self) -> None:
         # Create zero object in target type, build a zero morphism and bind it
-        # to the method __call__. Note: This is only possible, since the
-        # Multiton base class implements class isolation.
+        # to the slot __call__.
         zero = self._target.type()
         func = lambda *args: zero
-        meth = staticmethod(func)
-        setattr(type(self), '__call__', meth)
+        setattr(self, '__call__', func)
 
 class Identity(Operator):
     """Class for identity operators.
@@ -197,10 +272,8 @@ class Identity(Operator):
         else:
             func = func_args
 
-        # Bind the identity operator as a static method to the attribute
-        # __call__. Note: This is only possible, since the Multiton base class
-        # implements class isolation.
-        setattr(type(self), '__call__', staticmethod(func))
+        # Bind the identity operator to the slot __call__
+        setattr(self, '__call__', func)
 
     def __repr__(self) -> str:
         name = type(self).__name__
@@ -237,7 +310,9 @@ class Getter(Operator):
             target type is tuple.
 
     """
-    __slots__: StrList = []
+    __slots__: StrList = ['_columns']
+
+    _columns: Tuple[Tuple[OptOp, type], ...]
 
     def __new__(
             cls, *args: FieldID, domain: stype.DomLike = None,
@@ -283,7 +358,23 @@ class Getter(Operator):
         except TypeError:
             return f"{name}()"
 
+    def batch(self, seq: Sequence[Any], typed: bool = True) -> Any:
+        # Fetch the columns directly from the sequence, by mapping the per
+        # field fetch operators over the sequence. Thereby the fetch operators
+        # are builtins, such that the evaluation does not require any python
+        # function call per object.
+        if not isinstance(seq, Sequence):
+            seq = list(seq)
+        columns = []
+        for fetch, dtype in self._columns:
+            values = seq if fetch is None else map(fetch, seq)
+            columns.append(_create_column(values, dtype if typed else NoneType))
+        return _format_columns(columns, target=self._target)
+
     def _build(self, *args: Any) -> None:
+        # Build column fetch operators for the columnar evaluation
+        self._columns = self._build_columns(*args, domain=self._domain)
+
         # Build fetch and format operators
         fetch = self._build_fetch(*args, domain=self._domain)
         formatter = self._build_formatter(*args, target=self._target)
@@ -296,14 +387,37 @@ class Getter(Operator):
         if isinstance(formatter, Identity):
             getter = fetch
         elif isinstance(fetch, Identity):
-            getter = compose(formatter, lambda *args: args)
+            getter = compose(formatter, _pack)
         else:
             getter = compose(formatter, fetch)
 
-        # Bind the identity operator as a static method to the attribute
-        # __call__. Note: This is only possible, since the Multiton base class
-        # implements class isolation.
-        setattr(type(self), '__call__', staticmethod(getter))
+        # Bind the getter operator to the slot __call__
+        setattr(self, '__call__', getter)
+
+    def _build_columns(
+            self, *args: FieldID,
+            domain: stype.Domain) -> Tuple[Tuple[OptOp, type], ...]:
+        # Get the field types from the domain basis. The field types are used
+        # to store the columns of numeric fields in typed arrays.
+        dtypes = tuple(
+            getattr(domain.basis.get(arg), 'type', NoneType) for arg in args)
+
+        # If the domain type is NoneType and the domain frame comprises a
+        # single field, then the objects are the arguments itself. Otherwise
+        # the objects are tuples of arguments, which are fetched by their
+        # positions within the frame.
+        if domain.type == NoneType:
+            if len(domain.frame) == 1:
+                return tuple((None, dtype) for dtype in dtypes)
+            check.is_subset('fields', set(args), 'frame', set(domain.frame))
+            fetches = tuple(
+                operator.itemgetter(domain.frame.index(arg)) for arg in args)
+            return tuple(zip(fetches, dtypes))
+
+        # For all other domain types a fetch operator for a single field
+        # already is a builtin attribute getter or item getter
+        fetches = tuple(self._build_fetch(arg, domain=domain) for arg in args)
+        return tuple(zip(fetches, dtypes))
 
     def _build_fetch(self, *args: FieldID, domain: stype.Domain) -> AnyOp:
         # If the domain type is NoneType, the returned operator fetches and
@@ -361,22 +475,20 @@ class Getter(Operator):
             'domain type', domain.type, (object, Mapping, Sequence))
 
     def _build_formatter(self, *args: FieldID, target: stype.Domain) -> AnyOp:
-        # Create formatter
+        # Create formatter. Note: The formatters are module functions, which
+        # allows their inlining within compositions.
         if target.type == NoneType:
             return Identity()
         if target.type == tuple:
-            return lambda x: x if isinstance(x, tuple) else (x, )
+            return _as_tuple
         if target.type == list:
-            return lambda x: list(x) if isinstance(x, tuple) else [x]
+            return _as_list
         if target.type == dict:
             frame = target.frame
             if not frame:
                 raise ValueError(
                     "target type 'dict' requires the specification of fields")
-            first = frame[0]
-            d1: AnyOp = lambda x: {first: x} # arg -> dict
-            dn: AnyOp = lambda x: dict(zip(frame, x)) # args -> dict
-            return lambda x: dn(x) if isinstance(x, tuple) else d1(x)
+            return functools.partial(_as_dict, frame)
 
         # TODO: raise InvalidValueError!
         raise InvalidTypeError('target type', target.type, (tuple, list, dict))
@@ -401,10 +513,11 @@ class Lambda(Operator):
             is compiled after it is parsed.
 
     """
-    __slots__ = ['_expression', '_variables']
+    __slots__ = ['_expression', '_variables', '_parsed']
 
     _expression: str
     _variables: StrTuple
+    _parsed: parser.Expression
 
     def __new__(
             cls, expression: str = '', domain: stype.DomLike = None,
@@ -474,7 +587,7 @@ class Lambda(Operator):
         # provided the Zero(None) operator.
         if not self._expression:
             default = default or Zero().__call__
-            setattr(type(self), '__call__', staticmethod(default))
+            setattr(self, '__call__', default)
             return
 
         # If the domain uses a frame, the given field IDs of the domain are not
@@ -503,7 +616,12 @@ class Lambda(Operator):
         func = expr.as_func(compile=compile)
         final = compose(func, getter, unpack=True)
 
-        setattr(type(self), '__call__', staticmethod(final))
+        # Bind the parsed expression of compiled operators, which allows the
+        # inlining of the expression within generated code.
+        if compile:
+            self._parsed = expr
+
+        setattr(self, '__call__', final)
 
 class Vector(collections.abc.Sequence, Operator):
     """Class for vectorial functions.
@@ -643,42 +761,1043 @@ class Vector(collections.abc.Sequence, Operator):
             fields = tuple(var.frame[0] for var in variables)
             getter = Getter(*fields, domain=domain, target=target)
             func = getattr(getter, '__call__', getter)
-            setattr(type(self), '__call__', staticmethod(func))
+            setattr(self, '__call__', func)
             return
 
-        # If the mapper can not be implemented as a projection ...
-        # TODO: Implement as follows:
-        # 1. single getter
-        # 2. apply all component operators ...
-        # 3. single formatter
-        mapper: AnyOp
-        f = self._built_components
-        if len(self) == 1:
-            mapper = f[0]
-        elif len(self) == 2:
-            mapper = lambda *args: (f[0](*args), f[1](*args))
-        elif len(self) == 3:
-            mapper = lambda *args: (f[0](*args), f[1](*args), f[2](*args))
-        else:
-            mapper = lambda *args: tuple(comp(*args) for comp in f)
+        # If the mapper can not be implemented as a projection, generate a
+        # single function, which fetches every field once, evaluates the
+        # components with shared common subexpressions and directly returns an
+        # object of the target type.
+        builder = _FunctionBuilder(domain)
+        exprs = []
+        for var in variables:
+            names = builder.fetch(*var.frame)
+            exprs.append(builder.apply(var.operator, *names))
+        func = builder.build(builder.pack(exprs, target=target))
 
-        # Create formatter
-        formatter = Getter(
-            *components, domain=(None, components), target=target)
+        setattr(self, '__call__', func)
 
-        # If the formatter is an identity operator, return mapper. If the mapper
-        # is an identity operator, precede a tuple 'packer' to the formatter
-        if isinstance(formatter, Identity):
-            func = mapper
-        elif isinstance(mapper, Identity):
-            func = formatter
-        elif len(self) == 1:
-            func = compose(formatter, mapper)
+#
+# Code generation
+#
+
+# Native Python operators, which replace the calls of the respective operator
+# functions within generated code
+_BINOPS = {
+    operator.add: ast.Add, operator.sub: ast.Sub, operator.mul: ast.Mult,
+    operator.truediv: ast.Div, operator.floordiv: ast.FloorDiv,
+    operator.mod: ast.Mod, operator.pow: ast.Pow, operator.matmul: ast.MatMult,
+    operator.lshift: ast.LShift, operator.rshift: ast.RShift,
+    operator.and_: ast.BitAnd, operator.or_: ast.BitOr,
+    operator.xor: ast.BitXor}
+_UNARYOPS = {
+    operator.neg: ast.USub, operator.pos: ast.UAdd,
+    operator.invert: ast.Invert, operator.not_: ast.Not}
+_CMPOPS = {
+    operator.eq: ast.Eq, operator.ne: ast.NotEq, operator.lt: ast.Lt,
+    operator.le: ast.LtE, operator.gt: ast.Gt, operator.ge: ast.GtE,
+    operator.is_: ast.Is}
+
+# Types of Python literals, which are embedded as constants in generated code
+_LITERALS = (str, int, float, bool, NoneType)
+
+class _FunctionBuilder:
+    """Builder for generated functions over objects of a given domain.
+
+    The generated function fetches the required fields of its arguments once
+    and stores them in local variables. Thereupon the returned expression is
+    evaluated, where common subexpressions are evaluated only once. Within
+    the function body, intermediate results can be assigned to local variables
+    and guard statements can return early, which allows to fuse consecutive
+    stages of a pipeline into a single function.
+
+    Args:
+        domain: Domain of the generated function.
+
+    """
+    __slots__ = ['_domain', '_glob', '_consts', '_fields', '_lines']
+
+    _domain: stype.Domain
+    _glob: Dict[str, Any]
+    _consts: Dict[int, str]
+    _fields: Dict[FieldID, str]
+    _lines: List[ast.stmt]
+
+    def __init__(self, domain: stype.Domain) -> None:
+        self._domain = domain
+        self._glob = {'__builtins__': None}
+        self._consts = {}
+        self._fields = {}
+        self._lines = []
+
+    def const(self, obj: Any) -> str:
+        """Get the global name of an object within the generated function."""
+        name = self._consts.get(id(obj))
+        if name is None:
+            name = self._consts[id(obj)] = f'_g{len(self._consts)}'
+            self._glob[name] = obj
+        return name
+
+    def literal(self, obj: Any) -> str:
+        """Get a string representation of an object for generated code."""
+        if isinstance(obj, _LITERALS) and not isinstance(obj, float):
+            return repr(obj)
+        return self.const(obj)
+
+    def fetch(self, *fields: FieldID) -> Tuple[str, ...]:
+        """Fetch fields to local variables and get their names."""
+        names = []
+        for field in fields:
+            name = self._fields.get(field)
+            if name is None:
+                name = self._fields[field] = f'_f{len(self._fields)}'
+                source = f'{name} = {self._get_source(field)}'
+                self._lines.append(ast.parse(source).body[0])
+            names.append(name)
+        return tuple(names)
+
+    def assign(self, expr: ast.expr) -> str:
+        """Assign an expression to a local variable and get its name."""
+        name = f'_v{len(self._lines)}'
+        target = ast.Name(id=name, ctx=ast.Store())
+        self._lines.append(ast.Assign(targets=[target], value=expr))
+        return name
+
+    def guard(self, expr: ast.expr, value: Any = None) -> None:
+        """Return a value, if an expression does not evaluate to True."""
+        test = ast.UnaryOp(op=ast.Not(), operand=expr)
+        result = self._parse(self.literal(value))
+        self._lines.append(
+            ast.If(test=test, body=[ast.Return(value=result)], orelse=[]))
+
+    def apply(self, op: AnyOp, *names: str) -> ast.expr:
+        """Get an expression, that applies an operator to local variables."""
+        args = [ast.Name(id=name, ctx=ast.Load()) for name in names]
+
+        # Identity operators are replaced by their arguments and compiled
+        # lambda operators by their inlined expression
+        if isinstance(op, Identity):
+            if len(args) == 1:
+                return args[0]
+            return ast.Tuple(elts=args, ctx=ast.Load())
+        if isinstance(op, Lambda):
+            expr = self._inline(op, *names)
+            if expr is not None:
+                return expr
+
+        # Operators without a frame are applied to the original arguments,
+        # all other operators are called with the fetched fields.
+        func = ast.Name(id=self.const(op), ctx=ast.Load())
+        if not names:
+            args = [self._get_args()]
+        return ast.Call(func=func, args=args, keywords=[])
+
+    def pack(self, exprs: List[ast.expr], target: stype.Domain) -> ast.expr:
+        """Get an expression, that represents expressions in a target type."""
+        elts = list(exprs)
+        if target.type == dict:
+            keys = [self._parse(self.literal(key)) for key in target.frame]
+            return ast.Dict(keys=keys, values=elts)
+        if target.type == list:
+            return ast.List(elts=elts, ctx=ast.Load())
+        if target.type == NoneType and len(elts) == 1:
+            return elts[0]
+        if target.type in (tuple, NoneType):
+            return ast.Tuple(elts=elts, ctx=ast.Load())
+
+        raise ValueError(
+            f"target type '{target.type.__name__}' is not supported")
+
+    def build(self, expr: ast.expr, name: str = 'func') -> AnyOp:
+        """Generate a function, that returns the given expression."""
+        param = '*args' if self._domain.type == NoneType else 'obj'
+        tree = ast.parse(f'def {name}({param}):\n    return None')
+        func = tree.body[0]
+
+        # Evaluate common subexpressions once, by assigning them to local
+        # variables in front of the return statement
+        stmts, expr = _eliminate_subexpressions(expr)
+        func.body = ( # type: ignore
+            self._lines + stmts + [ast.Return(value=expr)])
+        ast.fix_missing_locations(tree)
+
+        # Compile the function within the global namespace
+        code = compile(tree, filename='<operator>', mode='exec')
+        exec(code, self._glob) # pylint: disable=W0122
+        return self._glob.pop(name)
+
+    def _get_args(self) -> ast.expr:
+        # Get the original arguments of the function
+        if self._domain.type == NoneType:
+            return ast.Starred(
+                value=ast.Name(id='args', ctx=ast.Load()), ctx=ast.Load())
+        return ast.Name(id='obj', ctx=ast.Load())
+
+    def _get_source(self, field: FieldID) -> str:
+        # Get the source code, that fetches a field from the arguments
+        dom = self._domain
+        if dom.type == NoneType:
+            return f'args[{dom.frame.index(field)}]'
+        if dom.type == object:
+            parts = str(field).split('.')
+            if all(part.isidentifier() for part in parts):
+                return f'obj.{field}'
+            return f'{self.const(operator.attrgetter(field))}(obj)'
+        if issubclass(dom.type, Mapping):
+            return f'obj[{self.literal(field)}]'
+        if issubclass(dom.type, Sequence):
+            if dom.frame:
+                return f'obj[{dom.frame.index(field)}]'
+            return f'obj[{int(field)}]' # type: ignore
+
+        raise ValueError(
+            f"domain type '{dom.type.__name__}' is not supported")
+
+    def _inline(self, op: 'Lambda', *names: str) -> Optional[ast.expr]:
+        # Inline the parsed expression of a compiled lambda operator. Thereby
+        # the variables of the expression are substituted by the local names
+        # of the fetched fields, which are passed in the order of the domain
+        # frame of the operator. All global names of the expression are
+        # substituted by global names of the generated function, such that
+        # equal functions within different operators share their names.
+        expr = getattr(op, '_parsed', None)
+        if expr is None:
+            return None
+        term, glob = expr.as_term()
+        frame = op.domain.frame
+        subst = {}
+        for var, field in zip(expr.variables, expr.origin):
+            if field not in frame or frame.index(field) >= len(names):
+                return None
+            subst[var] = names[frame.index(field)]
+        node = self._parse(term)
+        for sub in ast.walk(node):
+            if not isinstance(sub, ast.Name):
+                continue
+            if sub.id in subst:
+                sub.id = subst[sub.id]
+            elif sub.id in glob:
+                sub.id = self.const(glob[sub.id])
+            else:
+                return None
+        return _NativeOperators(self._glob).visit(node)
+
+    def _parse(self, source: str) -> ast.expr:
+        # Parse the source code of an expression
+        return ast.parse(source, mode='eval').body # type: ignore
+
+class _NativeOperators(ast.NodeTransformer):
+    """Replace calls of operator functions by native Python operators."""
+
+    def __init__(self, glob: Dict[str, Any]) -> None:
+        self._glob = glob
+
+    def visit_Call(self, node: ast.Call) -> ast.expr: # pylint: disable=C0103
+        self.generic_visit(node)
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            return node
+        if any(isinstance(arg, ast.Starred) for arg in node.args):
+            return node
+        try:
+            func = self._glob.get(node.func.id)
+            if len(node.args) == 2 and func in _BINOPS:
+                return ast.BinOp(
+                    left=node.args[0], op=_BINOPS[func](), right=node.args[1])
+            if len(node.args) == 2 and func in _CMPOPS:
+                return ast.Compare(
+                    left=node.args[0], ops=[_CMPOPS[func]()],
+                    comparators=[node.args[1]])
+            if len(node.args) == 1 and func in _UNARYOPS:
+                return ast.UnaryOp(op=_UNARYOPS[func](), operand=node.args[0])
+        except TypeError: # Unhashable functions
+            pass
+        return node
+
+def _eliminate_subexpressions(
+        expr: ast.expr) -> Tuple[List[ast.stmt], ast.expr]:
+    # Count the occurrences of compound subexpressions
+    compound = (ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call)
+    counts: Dict[str, int] = collections.Counter()
+    for node in ast.walk(expr):
+        if isinstance(node, compound):
+            counts[ast.dump(node)] += 1
+
+    # Substitute repeated subexpressions by local variables. Thereby the
+    # expression tree is traversed in post-order, such that the assignments of
+    # nested subexpressions preceed the assignments of their parents. Nested
+    # subexpressions, which only repeat as parts of a substituted parent, are
+    # not substituted.
+    stmts: List[ast.stmt] = []
+    temps: Dict[str, str] = {}
+    def substitute(node: ast.AST, outer: int = 1) -> ast.AST:
+        key = ast.dump(node) if isinstance(node, compound) else None
+        count = counts[key] if key else 0
+        inner = count if count > outer else outer
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                setattr(node, field, [
+                    substitute(item, inner)
+                    if isinstance(item, ast.AST) else item for item in value])
+            elif isinstance(value, ast.expr):
+                setattr(node, field, substitute(value, inner))
+        if count <= outer:
+            return node
+        name = temps.get(key)
+        if name is None:
+            name = temps[key] = f'_t{len(temps)}'
+            target = ast.Name(id=name, ctx=ast.Store())
+            stmts.append(ast.Assign(targets=[target], value=node))
+        return ast.Name(id=name, ctx=ast.Load())
+
+    return stmts, substitute(expr) # type: ignore
+
+#
+# Accumulators
+#
+
+class Accumulator(collections.abc.Callable): # type: ignore
+    """Abstract Base Class for incremental aggregation functions.
+
+    Accumulators evaluate :term:`aggregation functions <aggregation function>`
+    incrementally. Thereby an initial state is successively updated by the
+    values of a sequence and the final state is converted to the aggregate.
+    Since the states, which are accumulated from disjoint parts of a sequence,
+    can be merged, accumulators allow the aggregation of sequences in constant
+    memory, as well as the combination of partial aggregates. If called with
+    columns, accumulators behave like the respective aggregation functions.
+
+    """
+    __slots__: StrList = []
+
+    def __call__(self, *args: Iterable[Any]) -> Any:
+        state = self.initialize()
+        update = self.update
+        values = args[0] if len(args) == 1 else zip(*args)
+        for value in values:
+            state = update(state, value)
+        return self.finalize(state)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+    @abc.abstractmethod
+    def initialize(self) -> Any:
+        """Create the initial state of the accumulator."""
+        raise NotImplementedError(
+            f"'{type(self).__name__}' is required "
+            "to implement a method 'initialize'")
+
+    @abc.abstractmethod
+    def update(self, state: Any, value: Any) -> Any:
+        """Update a state by a value and return the updated state.
+
+        Args:
+            state: State of the accumulator
+            value: Value of the aggregated field. For aggregations over
+                multiple fields, the value is given by a tuple.
+
+        """
+        raise NotImplementedError(
+            f"'{type(self).__name__}' is required "
+            "to implement a method 'update'")
+
+    @abc.abstractmethod
+    def merge(self, state: Any, other: Any) -> Any:
+        """Merge two states and return the merged state."""
+        raise NotImplementedError(
+            f"'{type(self).__name__}' is required "
+            "to implement a method 'merge'")
+
+    def finalize(self, state: Any) -> Any:
+        """Convert a state to the aggregate."""
+        return state
+
+class InvertibleAccumulator(Accumulator):
+    """Abstract Base Class for accumulators, that allow the removal of values.
+
+    Invertible accumulators are able to remove values from a state, which
+    previously have been added to it. This allows the incremental aggregation
+    of sliding windows, where the values that leave a window are removed from
+    its state.
+
+    """
+    __slots__: StrList = []
+
+    @abc.abstractmethod
+    def remove(self, state: Any, value: Any) -> Any:
+        """Remove a value from a state and return the updated state.
+
+        Args:
+            state: State of the accumulator, which has been updated by the
+                value.
+            value: Value of the aggregated field. For aggregations over
+                multiple fields, the value is given by a tuple.
+
+        """
+        raise NotImplementedError(
+            f"'{type(self).__name__}' is required "
+            "to implement a method 'remove'")
+
+class First(Accumulator):
+    """Accumulator for the first value of a sequence."""
+    __slots__: StrList = []
+
+    def __call__(self, *args: Iterable[Any]) -> Any:
+        values = args[0] if len(args) == 1 else zip(*args)
+        return next(iter(values), None)
+
+    def initialize(self) -> Any:
+        return None, False
+
+    def update(self, state: Any, value: Any) -> Any:
+        return state if state[1] else (value, True)
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return state if state[1] else other
+
+    def finalize(self, state: Any) -> Any:
+        return state[0]
+
+class Count(InvertibleAccumulator):
+    """Accumulator for the number of values of a sequence."""
+    __slots__: StrList = []
+
+    def __call__(self, *args: Iterable[Any]) -> Any:
+        if isinstance(args[0], collections.abc.Sized):
+            return len(args[0])
+        return super().__call__(*args)
+
+    def initialize(self) -> Any:
+        return 0
+
+    def update(self, state: Any, value: Any) -> Any:
+        return state + 1
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return state + other
+
+    def remove(self, state: Any, value: Any) -> Any:
+        return state - 1
+
+class Sum(InvertibleAccumulator):
+    """Accumulator for the sum of the values of a sequence."""
+    __slots__: StrList = []
+
+    update = staticmethod(operator.add) # type: ignore
+    merge = staticmethod(operator.add) # type: ignore
+    remove = staticmethod(operator.sub) # type: ignore
+
+    def __call__(self, *args: Iterable[Any]) -> Any:
+        if len(args) == 1:
+            return sum(args[0])
+        return super().__call__(*args)
+
+    def initialize(self) -> Any:
+        return 0
+
+class Min(Accumulator):
+    """Accumulator for the minimum of the values of a sequence.
+
+    The minimum of an empty sequence is None.
+
+    """
+    __slots__: StrList = []
+
+    def __call__(self, *args: Iterable[Any]) -> Any:
+        values = args[0] if len(args) == 1 else zip(*args)
+        return min(values, default=None)
+
+    def initialize(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        return value if state is None or value < state else state
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return state if other is None else self.update(state, other)
+
+class Max(Accumulator):
+    """Accumulator for the maximum of the values of a sequence.
+
+    The maximum of an empty sequence is None.
+
+    """
+    __slots__: StrList = []
+
+    def __call__(self, *args: Iterable[Any]) -> Any:
+        values = args[0] if len(args) == 1 else zip(*args)
+        return max(values, default=None)
+
+    def initialize(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        return value if state is None or value > state else state
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return state if other is None else self.update(state, other)
+
+class Mean(InvertibleAccumulator):
+    """Accumulator for the arithmetic mean of the values of a sequence.
+
+    The mean of an empty sequence is NaN.
+
+    """
+    __slots__: StrList = []
+
+    def initialize(self) -> Any:
+        return 0, 0
+
+    def update(self, state: Any, value: Any) -> Any:
+        return state[0] + 1, state[1] + value
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return state[0] + other[0], state[1] + other[1]
+
+    def remove(self, state: Any, value: Any) -> Any:
+        return state[0] - 1, state[1] - value
+
+    def finalize(self, state: Any) -> Any:
+        return state[1] / state[0] if state[0] else NaN
+
+class Variance(InvertibleAccumulator):
+    """Accumulator for the variance of the values of a sequence.
+
+    The variance is updated by Welford's online algorithm and merged by the
+    pairwise algorithm of Chan et al., which are both numerically stable.
+    Values are removed by the inversion of Welford's update.
+
+    Args:
+        ddof: Delta degrees of freedom. The divisor, which is used in the
+            calculation of the variance is `N - ddof`, where `N` is the number
+            of values. By default `ddof` is zero, such that the population
+            variance is calculated. For `ddof = 1` the unbiased sample variance
+            is calculated. If `N` does not exceed `ddof` the variance is NaN.
+
+    """
+    __slots__: StrList = ['_ddof']
+
+    _ddof: int
+
+    def __init__(self, ddof: int = 0) -> None:
+        self._ddof = ddof
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(ddof={self._ddof})"
+
+    def initialize(self) -> Any:
+        return 0, 0., 0.
+
+    def update(self, state: Any, value: Any) -> Any:
+        n, mean, m2 = state
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        return n, mean, m2 + delta * (value - mean)
+
+    def merge(self, state: Any, other: Any) -> Any:
+        n_a, mean_a, m2_a = state
+        n_b, mean_b, m2_b = other
+        n = n_a + n_b
+        if not n:
+            return state
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        return n, mean, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+    def remove(self, state: Any, value: Any) -> Any:
+        n, mean, m2 = state
+        n -= 1
+        if not n:
+            return 0, 0., 0.
+        new = mean + (mean - value) / n
+        return n, new, m2 - (value - mean) * (value - new)
+
+    def finalize(self, state: Any) -> Any:
+        n, _, m2 = state
+        return m2 / (n - self._ddof) if n > self._ddof else NaN
+
+@catalog.register(
+    catalog.Statistic, name='distinct_count', tags=('approximate', ))
+class HyperLogLog(Accumulator):
+    """Accumulator for the approximate number of distinct values.
+
+    The number of distinct values is estimated by the HyperLogLog algorithm of
+    Flajolet et al., which only requires memory for a fixed number of
+    registers. Thereby the values are hashed by BLAKE2, such that the states of
+    different processes can be merged. The relative standard error of the
+    estimation is about `1.04 / sqrt(2 ** precision)`.
+
+    Strings are hashed by their encoding and all other values by their
+    representation, where numbers, which equal integers, are represented as
+    integers, such that `1`, `1.0` and `True` are counted as a single value.
+    The representation of other values is required to be equal for equal
+    values and stable across processes. Therefore objects, which inherit the
+    default representation from :class:`object`, are not supported.
+
+    Args:
+        precision: Number of bits of the hash values, that are used to select
+            the registers. The number of registers is `2 ** precision`. The
+            default precision is 12, which gives a relative standard error of
+            about 1.6%.
+
+    """
+    __slots__: StrList = ['_precision']
+
+    _precision: int
+
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError(
+                f"'precision' is required to be within 4 and 16, "
+                f"not {precision}")
+        self._precision = precision
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(precision={self._precision})"
+
+    def initialize(self) -> Any:
+        return bytearray(1 << self._precision)
+
+    def update(self, state: Any, value: Any) -> Any:
+        # Hash the value to 64 bits. The first bits select the register and
+        # the position of the leftmost 1-bit of the remaining bits updates the
+        # register.
+        data = self._encode(value)
+        digest = hashlib.blake2b(data, digest_size=8).digest()
+        code = int.from_bytes(digest, 'little')
+        bits = 64 - self._precision
+        pos = code >> bits
+        rank = bits - (code & ((1 << bits) - 1)).bit_length() + 1
+        if rank > state[pos]:
+            state[pos] = rank
+        return state
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return bytearray(map(max, state, other))
+
+    def finalize(self, state: Any) -> Any:
+        # Estimate the cardinality by the harmonic mean of the registers. For
+        # small cardinalities with empty registers, use linear counting.
+        # Thereby the bias correction of small numbers of registers is given
+        # by the constants of Flajolet et al.
+        size = len(state)
+        alpha = {16: .673, 32: .697, 64: .709}.get(
+            size, .7213 / (1. + 1.079 / size))
+        estimate = alpha * size * size / sum(2. ** -rank for rank in state)
+        zeros = state.count(0)
+        if zeros and estimate <= 2.5 * size:
+            estimate = size * math.log(size / zeros)
+        return int(round(estimate))
+
+    def _encode(self, value: Any) -> bytes:
+        # Encode the value, such that equal numbers have equal encodings and
+        # the encodings do not depend on the process. Thereby the encodings of
+        # representations are prefixed, such that they differ from strings.
+        if isinstance(value, str):
+            return value.encode()
+        if isinstance(value, int) or (
+                isinstance(value, float) and value.is_integer()):
+            return b'\0' + repr(int(value)).encode()
+        if type(value).__repr__ is object.__repr__:
+            raise ValueError(
+                f"type '{type(value).__name__}' is not supported")
+        return b'\0' + repr(value).encode()
+
+@catalog.register(catalog.Statistic, name='quantile', tags=('approximate', ))
+class Quantile(Accumulator):
+    """Accumulator for approximate quantiles of the values of a sequence.
+
+    The quantile is estimated by the KLL sketch of Karnin, Lang and Liberty,
+    which keeps a bounded number of values within a hierarchy of compactors.
+    Thereby the values are required to be comparable. The quantile of an empty
+    sequence is NaN.
+
+    Args:
+        q: Optional probability of the quantile, which is within 0 and 1. The
+            default is 0.5, which gives the median.
+        k: Optional size of the largest compactor, which controls the accuracy
+            and the memory of the sketch. The rank error is about `1.7 / k`.
+            The default size is 200.
+
+    """
+    __slots__: StrList = ['_q', '_k']
+
+    _q: float
+    _k: int
+
+    def __init__(self, q: float = .5, k: int = 200) -> None:
+        if not 0. <= q <= 1.:
+            raise ValueError(f"'q' is required to be within 0 and 1, not {q}")
+        self._q = q
+        self._k = k
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(q={self._q}, k={self._k})"
+
+    def initialize(self) -> Any:
+        return [0, [[]], 0]
+
+    def update(self, state: Any, value: Any) -> Any:
+        state[0] += 1
+        levels = state[1]
+        levels[0].append(value)
+        if len(levels[0]) >= self._capacity(0, len(levels)):
+            self._compress(state)
+        return state
+
+    def merge(self, state: Any, other: Any) -> Any:
+        levels = [list(items) for items in state[1]]
+        for height, items in enumerate(other[1]):
+            if height < len(levels):
+                levels[height] += items
+            else:
+                levels.append(list(items))
+        merged = [state[0] + other[0], levels, state[2] + other[2]]
+        self._compress(merged)
+        return merged
+
+    def finalize(self, state: Any) -> Any:
+        # Weight the values by the heights of their compactors and get the first
+        # value, which cumulative weight reaches the rank of the quantile
+        count, levels, _ = state
+        if not count:
+            return NaN
+        items = sorted(
+            (value, 1 << height)
+            for height, values in enumerate(levels) for value in values)
+        rank = self._q * count
+        total = 0
+        for value, weight in items:
+            total += weight
+            if total >= rank:
+                return value
+        return items[-1][0]
+
+    def _capacity(self, height: int, depth: int) -> int:
+        # Capacities decrease geometrically from the top to the lower levels
+        return max(2, int(self._k * (2. / 3.) ** (depth - height - 1)))
+
+    def _compress(self, state: Any) -> None:
+        # Compact the lowest level, that exceeds its capacity, by promoting
+        # every other value of the sorted level to the next level. If the level
+        # contains an odd number of values, the last value is kept. The offset
+        # of the promoted values alternates with the number of compactions,
+        # which avoids a systematic bias of the ranks.
+        levels = state[1]
+        while True:
+            for height, items in enumerate(levels):
+                if len(items) >= self._capacity(height, len(levels)):
+                    break
+            else:
+                return
+            if height + 1 == len(levels):
+                levels.append([])
+            items.sort()
+            size = len(items) - len(items) % 2
+            levels[height + 1] += items[state[2] % 2:size:2]
+            levels[height] = items[size:]
+            state[2] += 1
+
+class _Accumulation:
+    """Vector of Accumulators for the variables of an aggregation.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`, where the
+            operators are required to be accumulators.
+        domain: Domain of the accumulated objects.
+        target: Target type of the aggregates, which is tuple or dict. Like
+            for the aggregation by a :class:`Vector`, the aggregate of a single
+            variable is not given as a tuple, but as a scalar.
+
+    """
+    __slots__ = [
+        '_accumulators', '_components', '_fetch', '_updates', '_target']
+
+    _accumulators: Tuple[Accumulator, ...]
+    _components: Tuple[str, ...]
+    _fetch: AnyOp
+    _updates: Tuple[Tuple[AnyOp, AnyOp], ...]
+    _target: type
+
+    def __init__(
+            self, *args: stype.VarLike, domain: stype.DomLike = None,
+            target: type = tuple) -> None:
+        if target not in (tuple, dict):
+            raise ValueError(f"type '{target.__name__}' is not supported")
+        variables = _create_variables(*args)
+        self._accumulators = tuple(var.operator for var in variables)
+        self._components = tuple(var.name for var in variables)
+        self._target = target
+
+        # Create a single fetch operator for all fields of the variables and
+        # per variable an update operator and an item getter, that gets the
+        # variable's values from the fetched fields
+        fields: List[FieldID] = []
+        for var in variables:
+            fields += [field for field in var.frame if not field in fields]
+        self._fetch = Getter(*fields, domain=domain, target=tuple)
+        updates = []
+        for var in variables:
+            get = operator.itemgetter(*map(fields.index, var.frame))
+            updates.append((var.operator.update, get))
+        self._updates = tuple(updates)
+
+    def __call__(self, seq: Iterable[Any]) -> Any:
+        states = self.initialize()
+        update = self.update
+        for obj in seq:
+            update(states, obj)
+        return self.finalize(states)
+
+    def initialize(self) -> list:
+        return [acc.initialize() for acc in self._accumulators]
+
+    def update(self, states: list, obj: Any) -> None:
+        values = self._fetch(obj)
+        for i, (update, get) in enumerate(self._updates):
+            states[i] = update(states[i], get(values))
+
+    def merge(self, states: list, other: list) -> list:
+        return [
+            acc.merge(a, b)
+            for acc, a, b in zip(self._accumulators, states, other)]
+
+    def finalize(self, states: list) -> Any:
+        values = tuple(
+            acc.finalize(state)
+            for acc, state in zip(self._accumulators, states))
+        if self._target == dict:
+            return dict(zip(self._components, values))
+        if len(values) == 1:
+            return values[0]
+        return values
+
+class _Window:
+    """Sliding window aggregation of the variables of an aggregation.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`.
+        domain: Domain of the aggregated objects.
+        target: Target type of the aggregates, which is tuple or dict. Like
+            for the :class:`_Accumulation`, the aggregate of a single variable
+            is not given as a tuple, but as a scalar.
+        size: Number of objects within a window.
+        step: Number of objects, by which consecutive windows are shifted.
+
+    """
+    __slots__ = [
+        '_components', '_fetch', '_getters', '_kinds', '_multiple',
+        '_operators', '_size', '_step', '_target']
+
+    _components: Tuple[str, ...]
+    _fetch: AnyOp
+    _getters: Tuple[AnyOp, ...]
+    _kinds: Tuple[str, ...]
+    _multiple: Tuple[bool, ...]
+    _operators: Tuple[AnyOp, ...]
+    _size: int
+    _step: int
+    _target: type
+
+    def __init__(
+            self, *args: stype.VarLike, domain: stype.DomLike = None,
+            target: type = tuple, size: int = 1, step: int = 1) -> None:
+        if target not in (tuple, dict):
+            raise ValueError(f"type '{target.__name__}' is not supported")
+        if size < 1 or step < 1:
+            raise ValueError(
+                "the parameters 'size' and 'step' are required to be positive")
+        variables = _create_variables(*args)
+        self._components = tuple(var.name for var in variables)
+        self._operators = tuple(var.operator for var in variables)
+        self._target = target
+        self._size = size
+        self._step = step
+
+        # Create a single fetch operator for all fields of the variables and
+        # per variable an item getter, that gets the variable's values from the
+        # fetched fields
+        fields: List[FieldID] = []
+        for var in variables:
+            fields += [field for field in var.frame if not field in fields]
+        self._fetch = Getter(*fields, domain=domain, target=tuple)
+        self._getters = tuple(
+            operator.itemgetter(*map(fields.index, var.frame))
+            for var in variables)
+        self._multiple = tuple(len(var.frame) > 1 for var in variables)
+
+        # Determine the kind of the window state of the variables. Invertible
+        # accumulators are updated by the values, that enter and leave the
+        # window, minima and maxima are given by monotonic queues and all other
+        # aggregation functions are evaluated for the values of the window.
+        kinds = []
+        for op in self._operators:
+            if isinstance(op, InvertibleAccumulator):
+                kinds.append('invertible')
+            elif isinstance(op, Min):
+                kinds.append('min')
+            elif isinstance(op, Max):
+                kinds.append('max')
+            else:
+                kinds.append('other')
+        self._kinds = tuple(kinds)
+
+    def __call__(self, seq: Iterable[Any]) -> Iterator[Any]:
+        slide = self.slide()
+        for obj in seq:
+            result = slide.send(obj)
+            if result is not _MISSING:
+                yield result
+
+    def slide(self) -> Generator[Any, Any, None]:
+        """Get a generator, that is sent the objects one by one.
+
+        Returns:
+            Primed generator, which for any sent object returns the aggregate
+            of the window, that ends with the object, or the sentinel
+            _MISSING, if no window ends with the object.
+
+        """
+        generator = self._slide()
+        next(generator)
+        return generator
+
+    def _slide(self) -> Generator[Any, Any, None]:
+        size, step = self._size, self._step
+        fetch, getters = self._fetch, self._getters
+        items = tuple(zip(self._kinds, self._operators, getters))
+        window: collections.deque = collections.deque()
+        states = [
+            op.initialize() if kind == 'invertible' else collections.deque()
+            for kind, op, _ in items]
+        result = None
+        for pos in itertools.count():
+            obj = yield result
+            result = _MISSING
+            values = fetch(obj)
+            window.append(values)
+            if len(window) > size:
+                first = window.popleft()
+            else:
+                first = None
+            for i, (kind, op, get) in enumerate(items):
+                if kind == 'invertible':
+                    state = op.update(states[i], get(values))
+                    if first is not None:
+                        state = op.remove(state, get(first))
+                    states[i] = state
+                elif kind in ('min', 'max'):
+                    self._push(states[i], pos, get(values), kind == 'min')
+            start = pos - size + 1
+            if start < 0 or start % step:
+                continue
+            result = self._finalize(states, window)
+
+    def _push(
+            self, queue: collections.deque, pos: int, value: Any,
+            ascending: bool) -> None:
+        # Push the value to the monotonic queue, after the removal of all values
+        # that can not become the extremum of any later window. Thereupon
+        # remove the extremum, if it has left the window.
+        if ascending:
+            while queue and not queue[-1][1] < value:
+                queue.pop()
         else:
-            func = compose(formatter, mapper, unpack=True)
+            while queue and not queue[-1][1] > value:
+                queue.pop()
+        queue.append((pos, value))
+        if queue[0][0] <= pos - self._size:
+            queue.popleft()
+
+    def _finalize(self, states: list, window: collections.deque) -> Any:
+        values = []
+        for i, op in enumerate(self._operators):
+            kind = self._kinds[i]
+            if kind == 'invertible':
+                values.append(op.finalize(states[i]))
+            elif kind in ('min', 'max'):
+                values.append(states[i][0][1])
+            else:
+                column = map(self._getters[i], window)
+                if isinstance(op, Accumulator):
+                    values.append(op(column))
+                elif self._multiple[i]:
+                    values.append(op(*zip(*column)))
+                else:
+                    values.append(op(list(column)))
+        if self._target == dict:
+            return dict(zip(self._components, values))
+        if len(values) == 1:
+            return values[0]
+        return tuple(values)
+
+def _create_variables(*args: stype.VarLike) -> Tuple[stype.Variable, ...]:
+    # Create variables from variable definitions, where fields without an
+    # aggregation function are aggregated by their first value
+    return tuple(stype.create_variable(arg, default=First()) for arg in args)
+
+def _is_accumulation(*args: stype.VarLike) -> bool:
+    # Check if all aggregation functions of the variables are accumulators
+    variables = _create_variables(*args)
+    return all(isinstance(var.operator, Accumulator) for var in variables)
+
+#
+# Columnar representation of Operator results
+#
 
-        meth = staticmethod(func)
-        setattr(type(self), '__call__', meth)
+def _create_column(values: Iterable[Any], dtype: type = NoneType) -> Any:
+    # Store values of numeric field types within typed arrays and all other
+    # values within lists. Numeric fields, which contain values, that can not
+    # be stored in typed arrays, like None or integers, which exceed 64 bits,
+    # are also stored within lists.
+    values = list(values)
+    typecode = _TYPECODES.get(dtype)
+    if typecode:
+        try:
+            return array.array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return values
+
+def _format_columns(columns: List[Any], target: stype.Domain) -> Any:
+    # Represent the columns by an object of the target type. If no target type
+    # is given, a single column is returned as it is and multiple columns are
+    # represented by a tuple.
+    if target.type == NoneType:
+        if len(columns) == 1:
+            return columns[0]
+        return tuple(columns)
+    if target.type == tuple:
+        return tuple(columns)
+    if target.type == list:
+        return columns
+    if target.type == dict:
+        return dict(zip(target.frame, columns))
+
+    raise ValueError(
+        f"target type '{target.type.__name__}' is not supported")
+
+def _get_columns(
+        rows: List[Any], target: stype.Domain, typed: bool = True) -> Any:
+    # Get the columns from a list of rows, which are objects of the target
+    # domain. If no target frame is given or if the target is a single untyped
+    # field, then the rows already are the column.
+    frame = target.frame
+    dtypes = tuple(
+        getattr(target.basis.get(field), 'type', NoneType) if typed
+        else NoneType for field in frame)
+    if not frame or (len(frame) == 1 and target.type == NoneType):
+        return _create_column(rows, *dtypes)
+
+    # Get the columns from the rows, by using the target frame as keys for
+    # dictionaries and otherwise the positions of the fields within the frame
+    keys: Iterable[Any] = frame if target.type == dict else range(len(frame))
+    columns = []
+    for key, dtype in zip(keys, dtypes):
+        values = map(operator.itemgetter(key), rows)
+        columns.append(_create_column(values, dtype))
+    return _format_columns(columns, target=target)
 
 #
 # Operators that act on Operators
@@ -687,9 +1806,18 @@ class Vector(collections.abc.Sequence, Operator):
 def compose(*args: OptOp, unpack: bool = False) -> AnyOp:
     """Compose operators.
 
+    The composition is implemented by a single generated function, that
+    successively evaluates the operators. Thereby item getters, attribute
+    getters, identities and the formatters of getters are inlined, and built
+    operators are called by their built functions, such that a composition of
+    any number of operators only requires a single additional function call.
+
     Args:
         *args: Operators, which shall be composed. If provided, any given
             operator is required to be a callable or None.
+        unpack: Optional boolean parameter. If set to True, the results of the
+            operators are unpacked to the positional arguments of their
+            successors. By default the results are passed as single arguments.
 
     Returns:
         Composition of all arguments, that do not evaluate to False. If all
@@ -702,17 +1830,201 @@ def compose(*args: OptOp, unpack: bool = False) -> AnyOp:
 
     # Filter None and identity operators. If no arguments pass the filter, the
     # the default operator given by the identity is used.
-    use: AnyOp = lambda op: not(op is None or isinstance(args, Identity))
-    ops = tuple(filter(use, args)) or (Identity(), )
-
-    # Create pairwise composition operator and apply it to the remaining
-    # arguments
-    circ: AnyOp
-    if unpack:
-        circ = lambda f, g: lambda *cargs: f(*g(*cargs))
+    use: AnyOp = lambda op: not(op is None or isinstance(op, Identity))
+    ops = tuple(filter(use, args))
+    if not ops:
+        return Identity()
+    if len(ops) == 1:
+        return ops[0]
+
+    # Create a single function, that evaluates the operators in reversed
+    # order. If the innermost operator is an item getter or an attribute
+    # getter, the function takes a single argument. Otherwise the innermost
+    # operator is applied to all arguments of the function.
+    glob: Dict[str, Any] = {'__builtins__': None}
+    names: Dict[int, str] = {}
+    def const(obj: Any) -> str:
+        name = names.get(id(obj))
+        if name is None:
+            name = names[id(obj)] = f'_g{len(names)}'
+            glob[name] = obj
+        return name
+    getters = (operator.itemgetter, operator.attrgetter)
+    arg = 'obj' if isinstance(ops[-1], getters) else '*args'
+    lines = [f"def func({arg}):"]
+    for pos, op in enumerate(reversed(ops)):
+        term = _inline(op, arg, const)
+        if term is None:
+            term = f'{const(_unwrap(op))}({arg})'
+        lines.append(f'    _{pos} = {term}')
+        arg = f'*_{pos}' if unpack else f'_{pos}'
+    lines.append(f'    return _{pos}')
+
+    # Compile the function within its global namespace
+    exec('\n'.join(lines), glob) # pylint: disable=W0122
+    return glob.pop('func')
+
+def _unwrap(op: AnyOp) -> AnyOp:
+    # Get the built function of built operators, which avoids the lookup of the
+    # slot __call__ within any call of the operator
+    if isinstance(op, Operator):
+        return getattr(op, '__call__', op)
+    return op
+
+def _inline(op: AnyOp, arg: str, const: AnyOp) -> Optional[str]:
+    # Get the term of a known operator, which is applied to a given argument.
+    # If the argument is unpacked, only the boxing of the arguments can be
+    # inlined. If the operator can not be inlined, None is returned.
+    if op is _pack:
+        return 'args' if arg == '*args' else None
+    if arg.startswith('*'):
+        return None
+
+    # Inline item getters and attribute getters. Note, that the items of the
+    # getters are provided by their reduce method.
+    if isinstance(op, operator.itemgetter):
+        terms = [f'{arg}[{const(item)}]' for item in op.__reduce__()[1]]
+    elif isinstance(op, operator.attrgetter):
+        items = op.__reduce__()[1]
+        for item in items:
+            if not all(part.isidentifier() for part in item.split('.')):
+                return None
+        terms = [f'{arg}.{item}' for item in items]
     else:
-        circ = lambda f, g: lambda *cargs: f(g(*cargs))
-    return functools.reduce(circ, ops) or Identity()
+        terms = []
+    if len(terms) == 1:
+        return terms[0]
+    if terms:
+        return f"({', '.join(terms)})"
+
+    # Inline the formatters of getters
+    box = f'{const(isinstance)}({arg}, {const(tuple)})'
+    if op is _as_tuple:
+        return f'{arg} if {box} else ({arg}, )'
+    if op is _as_list:
+        return f'{const(list)}({arg}) if {box} else [{arg}]'
+    if isinstance(op, functools.partial) and op.func is _as_dict:
+        frame = op.args[0]
+        multi = f'{const(dict)}({const(zip)}({const(frame)}, {arg}))'
+        return f'{multi} if {box} else {{{const(frame[0])}: {arg}}}'
+    return None
+
+class CacheInfo(NamedTuple):
+    """Statistics of the cache of a memoized operator."""
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+def create_memoizer(
+        op: AnyOp, maxsize: Optional[int] = 128, key: Key = None,
+        domain: stype.DomLike = None) -> AnyOp:
+    """Create a memoized operator, that caches the results of an operator.
+
+    Args:
+        op: Operator or callable, which results only depend on the fields,
+            that are used as cache keys.
+        maxsize: Optional maximum number of cached results. If the maximum size
+            is exceeded, the least recently used results are discarded. If
+            maxsize is None, the cache is unbounded. The default maximum size
+            is 128.
+        key: Optional cache key. If provided, the cache key can be a
+            :term:`field identifier` or a composite key, given by a tuple of
+            field identifiers, which are fetched from the arguments of the
+            operator. By default the cache key of an operator with a domain
+            frame is given by the fields of its domain frame and otherwise by
+            all given arguments.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`. By
+            default the domain of the operator is used.
+
+    Returns:
+        Memoized operator, which provides the statistics of its cache by a
+        method `cache_info` and allows to clear its cache by a method
+        `cache_clear`.
+
+    """
+    if domain is None and isinstance(op, Operator):
+        domain = op.domain
+    if key is None and isinstance(op, Operator):
+        key = op.domain.frame or None
+    if key is None:
+        return _Memoizer(op, maxsize=maxsize)
+    keys = key if isinstance(key, tuple) else (key, )
+    fetch = Getter(*keys, domain=domain)
+    return _Memoizer(op, maxsize=maxsize, fetch=fetch)
+
+class _Memoizer:
+    """Operator, that caches the results of an operator by the fetched fields.
+
+    Args:
+        op: Operator, which results are cached.
+        maxsize: Maximum number of cached results or None.
+        fetch: Optional operator, that fetches the cache key from the
+            arguments. By default the tuple of the arguments is used.
+
+    """
+    __slots__ = ['_operator', '_maxsize', '_fetch', '_cache', '_counts']
+
+    _operator: AnyOp
+    _maxsize: Optional[int]
+    _fetch: OptOp
+    _cache: 'collections.OrderedDict[Any, Any]'
+    _counts: List[int]
+
+    def __init__(
+            self, op: AnyOp, maxsize: Optional[int] = 128,
+            fetch: OptOp = None) -> None:
+        self._operator = _unwrap(op)
+        self._maxsize = maxsize
+        self._fetch = fetch
+        self._cache = collections.OrderedDict()
+        self._counts = [0, 0]
+
+    def __call__(self, *args: Any) -> Any:
+        key = args if self._fetch is None else self._fetch(*args)
+        cache = self._cache
+        try:
+            value = cache[key]
+        except KeyError:
+            self._counts[1] += 1
+            value = cache[key] = self._operator(*args)
+            if self._maxsize is not None and len(cache) > self._maxsize:
+                cache.popitem(last=False)
+            return value
+        cache.move_to_end(key)
+        self._counts[0] += 1
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        hits, misses = self._counts
+        return CacheInfo(hits, misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+        self._counts = [0, 0]
+
+#
+# Formatters
+#
+
+def _pack(*args: Any) -> Tuple[Any, ...]:
+    # Pack arguments to a tuple
+    return args
+
+def _as_tuple(obj: Any) -> tuple:
+    # Represent a single object or a tuple of objects as tuple
+    return obj if isinstance(obj, tuple) else (obj, )
+
+def _as_list(obj: Any) -> list:
+    # Represent a single object or a tuple of objects as list
+    return list(obj) if isinstance(obj, tuple) else [obj]
+
+def _as_dict(frame: Frame, obj: Any) -> dict:
+    # Represent a single object or a tuple of objects as dictionary, which uses
+    # the given frame as keys
+    return dict(zip(frame, obj)) if isinstance(obj, tuple) else {frame[0]: obj}
 
 #
 # Builders for elementary operators
@@ -804,9 +2116,265 @@ def create_wrapper(**attrs: Any) -> AnyOp:
 # Builders for sequence operators
 #
 
+def create_filter(
+        expression: str, domain: stype.DomLike = None,
+        mask: bool = False) -> SeqOp:
+    """Create a filter with a fixed predicate expression.
+
+    Filters are operators, that act on sequences of objects of a given category
+    and select the objects, that satisfy a predicate. The predicate is parsed
+    and compiled once, and evaluated blockwise over the columns of the objects,
+    which avoids the fetching of the fields by a function call per object.
+
+    Args:
+        expression: Predicate, given as an expression, which is parsed and
+            compiled like the expression of a :class:`Lambda` operator. The
+            variables of the expression are required to be valid :term:`field
+            identifiers <field identifier>` for the domain type.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        mask: Optional boolean parameter. If set to True, the returned operator
+            does not select the objects, but returns a selection mask, given by
+            a list of booleans, which for each object within the sequence
+            determines if it satisfies the predicate.
+
+    Returns:
+        Callable function which takes a sequence or an iterator of objects of a
+        given domain and returns an iterator over the objects, that satisfy the
+        predicate, or a selection mask of the objects.
+
+    """
+    # Parse and compile the predicate. If the domain does not provide a frame,
+    # the frame is given by the fields of the expression.
+    dom = stype.create_domain(domain)
+    expr = parser.parse(expression, variables=dom.frame)
+    fields = tuple(expr.origin)
+    if not dom.frame:
+        dom = stype.create_domain((dom.type, fields))
+    func = expr.as_func()
+
+    # A predicate without fields is constant and therefore evaluated once
+    if not fields:
+        value = bool(func())
+        if mask:
+            return lambda seq: [value] * sum(1 for _ in seq)
+        return lambda seq: iter(seq) if value else iter(())
+
+    # Create an operator, that evaluates the predicate over the columns of the
+    # objects
+    columns = Getter(*fields, domain=dom, target=tuple).batch
+    evaluate: SeqOp = lambda seq: map(func, *columns(seq))
+    if mask:
+        return lambda seq: list(map(bool, evaluate(seq)))
+
+    # Create an operator, that selects the objects blockwise by their selection
+    # masks, such that also iterators are filtered lazily
+    def select(seq: Iterable[Any]) -> Iterator[Any]:
+        objs = iter(seq)
+        block = list(itertools.islice(objs, _BLOCK_SIZE))
+        while block:
+            yield from itertools.compress(block, evaluate(block))
+            block = list(itertools.islice(objs, _BLOCK_SIZE))
+    return select
+
+def create_distinct(
+        *args: FieldID, domain: stype.DomLike = None,
+        approximate: bool = False, capacity: int = 1000000,
+        error_rate: float = .001) -> SeqOp:
+    """Create an operator, that removes duplicates with respect to fixed keys.
+
+    Args:
+        *args: Optional *distinction keys*, which are used to identify
+            duplicates within sequences of objects of given domain type. If
+            provided, any key is required to be a valid :term:`field
+            identifier` for the domain type. By default the objects itself are
+            used as keys. In any case the keys are required to be hashable.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        approximate: Optional boolean parameter. By default the keys of the
+            returned objects are stored in a set, which requires memory for
+            each distinct key. If set to True, the keys are recorded by a Bloom
+            filter of fixed size. In this case objects are erroneously regarded
+            as duplicates with a small probability, given by the error rate.
+        capacity: Optional number of distinct keys, for which the Bloom filter
+            is dimensioned. This parameter is only used in the approximate
+            mode. The default capacity is 1 000 000.
+        error_rate: Optional probability of false positives of the Bloom filter,
+            if the number of distinct keys does not exceed its capacity. This
+            parameter is only used in the approximate mode. The default error
+            rate is 0.001.
+
+    Returns:
+        Callable function which takes a sequence or an iterator of objects of a
+        given domain and returns an iterator over the first occurrences of the
+        objects, that are distinct with respect to the given keys.
+
+    """
+    # Create getter for given keys
+    getter = Getter(*args, domain=domain) if args else None
+
+    # Create an operator, that records the keys within a Bloom filter
+    if approximate:
+        def approximate_distinct(seq: Iterable[Any]) -> Iterator[Any]:
+            seen = _BloomFilter(capacity=capacity, error_rate=error_rate)
+            for obj in seq:
+                if not seen.add(obj if getter is None else getter(obj)):
+                    yield obj
+        return approximate_distinct
+
+    # Create an operator, that records the keys within a set
+    def distinct(seq: Iterable[Any]) -> Iterator[Any]:
+        seen: set = set()
+        for obj in seq:
+            key = obj if getter is None else getter(obj)
+            if key not in seen:
+                seen.add(key)
+                yield obj
+    return distinct
+
+class _BloomFilter:
+    """Probabilistic set of hashable objects with a fixed memory size.
+
+    Args:
+        capacity: Number of distinct objects, for which the filter is
+            dimensioned.
+        error_rate: Probability of false positives, if the number of added
+            objects does not exceed the capacity.
+
+    """
+    __slots__ = ['_bits', '_size', '_hashes']
+
+    _bits: bytearray
+    _size: int
+    _hashes: int
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        # The optimal number of bits and hash functions for the given capacity
+        # and error rate
+        size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._size = max(size, 8)
+        self._hashes = max(round(self._size / capacity * math.log(2)), 1)
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def __contains__(self, obj: Hashable) -> bool:
+        bits = self._bits
+        return all(
+            bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(obj))
+
+    def add(self, obj: Hashable) -> bool:
+        """Add object to the filter.
+
+        Args:
+            obj: Hashable object
+
+        Returns:
+            True if the object probably already has been added to the filter,
+            and False if it certainly has not been added.
+
+        """
+        bits = self._bits
+        found = True
+        for pos in self._positions(obj):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                found = False
+        return found
+
+    def _positions(self, obj: Hashable) -> Iterator[int]:
+        # Derive the bit positions by double hashing, where both hash values
+        # are taken from a digest of the object's hash value. Thereby the hash
+        # values of small integers, which are the integers themselves, are
+        # mixed, such that their bit positions are uniformly distributed.
+        data = hash(obj).to_bytes(8, 'little', signed=True)
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        size = self._size
+        return ((first + i * second) % size for i in range(self._hashes))
+
+def create_sampler(
+        n: int, key: Key = None, domain: stype.DomLike = None,
+        seed: Optional[int] = None) -> SeqOp:
+    """Create an operator, that draws uniform random samples from sequences.
+
+    The samples are drawn by reservoir sampling, which takes a single pass over
+    the sequence and only requires memory for the sampled objects. Thereby
+    every subset of the given size has the same probability to be drawn.
+
+    Args:
+        n: Maximum number of objects within the sample. If a sequence, or a
+            group, contains less objects, all objects are returned.
+        key: Optional grouping key. If provided, the sample is stratified by
+            the groups, such that a sample is drawn from any group. The grouping
+            key can be a :term:`field identifier` or a composite key, given by
+            a tuple of field identifiers.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        seed: Optional seed of the random number generator, which allows to
+            reproduce samples. By default the generator is seeded by the
+            system.
+
+    Returns:
+        Callable function which takes a sequence or an iterator of objects of a
+        given domain and returns a list with the sampled objects. If a grouping
+        key is given, a list with the samples of the groups is returned, which
+        are ordered by the first occurrence of their groups within the
+        sequence.
+
+    """
+    # Create an operator, that draws a sample by skipping the objects, which
+    # are not inserted into the reservoir (Li's Algorithm L)
+    if key is None:
+        def sample(seq: Iterable[Any]) -> List[Any]:
+            rng = random.Random(seed)
+            objs = iter(seq)
+            reservoir = list(itertools.islice(objs, n))
+            if len(reservoir) < n or not n:
+                return reservoir
+            weight = math.exp(math.log(1. - rng.random()) / n)
+            while True:
+                skip = math.log(1. - rng.random()) / math.log1p(-weight)
+                obj = next(itertools.islice(objs, int(skip), None), _MISSING)
+                if obj is _MISSING:
+                    return reservoir
+                reservoir[rng.randrange(n)] = obj
+                weight *= math.exp(math.log(1. - rng.random()) / n)
+        return sample
+
+    # Create an operator, that draws a sample per group, by replacing a
+    # random object within the reservoir of the group (Vitter's Algorithm R).
+    # Note, that dictionaries preserve the insertion order of their keys, such
+    # that the samples are ordered by the first occurrence of their groups.
+    keys = key if isinstance(key, tuple) else (key, )
+    getter = Getter(*keys, domain=domain)
+    def stratified_sample(seq: Iterable[Any]) -> List[List[Any]]:
+        rng = random.Random(seed)
+        groups: Dict[Any, list] = {}
+        for obj in seq:
+            group = getter(obj)
+            try:
+                count, reservoir = groups[group]
+            except KeyError:
+                groups[group] = [1, [obj]]
+                continue
+            groups[group][0] = count = count + 1
+            if len(reservoir) < n:
+                reservoir.append(obj)
+                continue
+            pos = rng.randrange(count)
+            if pos < n:
+                reservoir[pos] = obj
+        return [reservoir for _, reservoir in groups.values()]
+    return stratified_sample
+
 def create_sorter(
         *args: FieldID, domain: stype.DomLike = None,
-        reverse: bool = False) -> SeqHom:
+        reverse: bool = False, limit: Optional[int] = None,
+        buffer_size: Optional[int] = None) -> SeqHom:
     """Create a sorter with fixed sorting keys.
 
     Sorters are operators, that act on sequences of objects of a given category
@@ -822,21 +2390,84 @@ def create_sorter(
             parameter values are documented in the class :class:`Getter`.
         reverse: Optional boolean parameter. If set to True, then the sequence
             elements are sorted as if each comparison were reversed.
+        limit: Optional maximum number of returned objects, which is required
+            to be a non-negative integer. If provided, only the first objects
+            of the sorted sequence are returned. Thereby the objects are
+            selected by a heap, which avoids the sorting of the full sequence.
+        buffer_size: Optional maximum number of objects, that are sorted in
+            memory. If provided, the sequence is sorted by an external merge
+            sort: The sequence is split into runs of the given size, which are
+            sorted and spilled to temporary files. Thereupon the runs are merged
+            and returned as an iterator. Thereby the objects of the sequence are
+            required to be picklable. The buffer size is not used, if a limit
+            is given.
 
     Returns:
         Callable function which sorts a sequence of objects of a given domain by
         given sorting keys.
 
     """
+    # Check the limit and the buffer size of external sorts
+    if limit is not None:
+        check.has_type("'limit'", limit, int)
+        check.is_not_negative("'limit'", limit)
+    if buffer_size is not None:
+        check.is_positive("'buffer_size'", buffer_size)
+
     # Create getter operator for given keys
     getter = Getter(*args, domain=domain) if args else None
 
-    # Create and return sorting operator
+    # Create and return sorting operator. Note: The heap based selections are
+    # stable and therefore equivalent to slices of the sorted sequence.
+    if limit is not None:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return lambda seq: select(limit, seq, key=getter)
+    if buffer_size is not None:
+        return lambda seq: _sort_external(
+            seq, key=getter, reverse=reverse, buffer_size=buffer_size)
     return lambda seq: sorted(seq, key=getter, reverse=reverse)
 
+def _sort_external(
+        seq: Iterable[Any], key: OptOp = None, reverse: bool = False,
+        buffer_size: int = 0) -> Iterator[Any]:
+    # Sort the first run in memory. If the sequence fits into a single run, the
+    # run is not required to be spilled.
+    objs = iter(seq)
+    run = sorted(
+        itertools.islice(objs, buffer_size), key=key, reverse=reverse)
+    if len(run) < buffer_size:
+        yield from run
+        return
+
+    # Spill the sorted runs to temporary files, which are deleted, when they
+    # are closed. Thereupon merge the runs, which are read blockwise from the
+    # files. Note: The merge is stable, since it prefers the earlier runs.
+    with contextlib.ExitStack() as stack:
+        files = []
+        while run:
+            file = stack.enter_context(tempfile.TemporaryFile())
+            for pos in range(0, len(run), _BLOCK_SIZE):
+                block = run[pos:pos + _BLOCK_SIZE]
+                pickle.dump(block, file, protocol=pickle.HIGHEST_PROTOCOL)
+            files.append(file)
+            run = sorted(
+                itertools.islice(objs, buffer_size), key=key, reverse=reverse)
+        runs = map(_read_run, files)
+        yield from heapq.merge(*runs, key=key, reverse=reverse)
+
+def _read_run(file: Any) -> Iterator[Any]:
+    file.seek(0)
+    while True:
+        try:
+            block = pickle.load(file)
+        except EOFError:
+            return
+        yield from block
+
 def create_grouper(
         *args: FieldID, domain: stype.DomLike = None,
-        presorted: bool = False) -> SeqOp:
+        presorted: bool = False, hashed: bool = False,
+        buffer_size: Optional[int] = None) -> SeqOp:
     """Create a grouping operator with fixed grouping keys.
 
     Args:
@@ -853,12 +2484,31 @@ def create_grouper(
             the sequences are already sorted, the first step is not required and
             can be omitted to increase the performance of the operator. By
             default the input sequences are assumed not to be presorted.
+        hashed: Optional boolean parameter. If set to True, the sequence is
+            partitioned in a single pass by using a hash table of the keys,
+            instead of sorting the sequence. In this case the grouping keys are
+            required to be hashable and the groups are returned in the order of
+            their first occurrence within the sequence. The hashed grouping
+            does not require comparable keys and has a linear time complexity.
+            By default the sequence is sorted.
+        buffer_size: Optional maximum number of objects, that are sorted in
+            memory. If provided, the sequence is sorted by an external merge
+            sort, as documented in :func:`create_sorter`, and the groups are
+            returned as an iterator. The buffer size is only used, if the
+            sequence is neither presorted nor hashed.
 
     Returns:
         List of sequences containing objects of a given domain typr, which are
         equal with respect to given grouping keys.
 
     """
+    # Check for mutually exclusive arguments
+    if presorted and hashed:
+        raise ValueError(
+            "the parameters 'presorted' and 'hashed' are mutually exclusive")
+    if buffer_size is not None:
+        check.is_positive("'buffer_size'", buffer_size)
+
     # The default grouper groups all sequence elements into a single group
     if not args:
         return lambda seq: [seq]
@@ -866,6 +2516,17 @@ def create_grouper(
     # Create getter for given keys
     getter = Getter(*args, domain=domain)
 
+    # Create grouper, that partitions the sequence by a hash table. Note, that
+    # dictionaries preserve the insertion order of their keys, such that the
+    # groups are ordered by their first occurrence.
+    if hashed:
+        def hash_grouper(seq: Iterable[Any]) -> List[list]:
+            groups: Dict[Any, list] = collections.defaultdict(list)
+            for obj in seq:
+                groups[getter(obj)].append(obj)
+            return list(groups.values())
+        return hash_grouper
+
     # Create list mapper for groups
     group = operator.itemgetter(1)
     mapper: SeqOp = lambda gseq: list(map(list, map(group, gseq)))
@@ -876,7 +2537,12 @@ def create_grouper(
     if presorted:
         return grouper
 
-    # Create grouper for unsorted sequences
+    # Create grouper for unsorted sequences. If a buffer size is given, the
+    # sequence is sorted externally and the groups are created lazily.
+    if buffer_size is not None:
+        return lambda seq: map(list, map(group, itertools.groupby(
+            _sort_external(seq, key=getter, buffer_size=buffer_size),
+            key=getter)))
     return lambda seq: grouper(sorted(seq, key=getter))
 
 def create_aggregator(
@@ -888,7 +2554,11 @@ def create_aggregator(
         *args: Optional :term:`variable definitions<variable definition>`. If
             provided the operators given within the variable definitions are
             required to be valid :term:`aggregation functions <aggregation
-            function>`
+            function>`. Fields without an aggregation function are aggregated
+            by their first value. If all aggregation functions are
+            :class:`accumulators <Accumulator>`, the returned operator
+            aggregates the objects incrementally, such that it accepts
+            arbitrary iterables and requires constant memory.
         domain: Optional domain category of the operator. If provided, the
             category has to be given as a :class:`type`. Supported types are
             :class:`object`, subclasses of the class:`Mapping class
@@ -909,18 +2579,20 @@ def create_aggregator(
     if not args:
         return Zero(target)
 
+    # If all aggregation functions are accumulators, return an operator, that
+    # incrementally aggregates the objects
+    if _is_accumulation(*args):
+        return _Accumulation(*args, domain=domain, target=target)
+
     # Create vectorial operator using the variable definitions
-    f = Vector(*args, default=operator.itemgetter(0))
+    f = Vector(*args, default=First())
 
-    # Create an operator, that converts data stored in rows to columns.
-    # 1. At first fetch the rows from the input sequence
-    # 2. Create a Matrix from the sequence (a list of rows)
-    # 3. Transpose a Matrix (to a tuple of columns)
-    # 4. Compose Matrix creation and transposition
+    # Create an operator, that fetches the data, which is stored in rows, as
+    # columns. Thereby the columnar evaluation of the getter avoids the
+    # creation and transposition of an intermediate matrix. The columns are
+    # passed to the aggregation functions as lists.
     getter = Getter(*f.fields, domain=domain, target=tuple)
-    matrix: SeqOp = lambda seq: list(map(getter, seq))
-    trans: SeqOp = lambda mat: tuple(list(col) for col in zip(*mat))
-    columns: SeqOp = lambda seq: trans(matrix(seq))
+    columns: SeqOp = functools.partial(getter.batch, typed=False)
 
     # If the requested type is tuple return an operator, that evaluates the
     # multivariate variable for the columns
@@ -936,7 +2608,10 @@ def create_aggregator(
 
 def create_group_aggregator(
         *args: stype.VarLike, key: Key = None, domain: stype.DomLike = None,
-        target: type = tuple, presorted: bool = False) -> SeqOp:
+        target: type = tuple, presorted: bool = False,
+        hashed: bool = False, buffer_size: Optional[int] = None,
+        max_groups: Optional[int] = None,
+        workers: Optional[int] = None) -> SeqOp:
     """Creates a group aggregation operator.
 
     Args:
@@ -972,24 +2647,1610 @@ def create_group_aggregator(
             not required and can be omitted to increase the performance of the
             operator. By default the input sequences are assumed not to be
             presorted.
+        hashed: Optional boolean parameter. If set to True, the groups are
+            created in a single pass by using a hash table of the grouping
+            keys, instead of sorting the sequence. In this case the aggregates
+            are returned in the order of the first occurrence of their groups
+            within the sequence. By default the sequence is sorted.
+        buffer_size: Optional maximum number of objects, that are sorted in
+            memory. If provided, the sequence is sorted by an external merge
+            sort, as documented in :func:`create_sorter`. The buffer size is
+            only used, if the sequence is neither presorted nor hashed.
+        max_groups: Optional maximum number of groups, which partial
+            aggregates are held in memory. If provided and the number of groups
+            exceeds the maximum, the partial aggregates are partitioned by the
+            hash values of the grouping keys and spilled to temporary files.
+            Finally the partitions are merged one by one, where partitions,
+            which still exceed the maximum, are recursively partitioned. Thereby
+            the aggregates remain ordered by the first occurrence of their
+            groups and the grouping keys and the partial aggregates are required
+            to be picklable. The maximum number of groups is only used, if the
+            sequence is hashed and all aggregation functions are
+            :class:`accumulators <Accumulator>`.
+        workers: Optional number of worker processes. If provided and a
+            grouping key is given, the groups are aggregated in parallel. If
+            all aggregation functions are :class:`accumulators <Accumulator>`,
+            the sequence is split into blocks, which are aggregated to partial
+            aggregates by the worker processes and merged. Otherwise the
+            sequence is partitioned by the hash values of the grouping keys and
+            the partitions are aggregated by the worker processes, which
+            requires the whole sequence to be held in memory by the parent
+            process. In both cases the aggregates are returned in the same
+            order as by the serial aggregation and the variable definitions,
+            the domain and the objects of the sequence are required to be
+            picklable. The number of worker processes can not be combined with
+            a buffer size or a maximum number of groups.
 
     Returns:
+        Operator, that returns an iterator over the aggregates of the groups. If
+        all aggregation functions are :class:`accumulators <Accumulator>`, the
+        objects are aggregated incrementally, such that the operator accepts
+        arbitrary iterables and only requires constant memory per group.
 
     """
+    # Check the buffer size of external sorts and the maximum number of
+    # groups of spilling hashed aggregations
+    if buffer_size is not None:
+        check.is_positive("'buffer_size'", buffer_size)
+    if max_groups is not None:
+        check.is_positive("'max_groups'", max_groups)
+
     # Group aggregators require variable definitions
     if not args:
         return Identity(domain=domain)
 
+    # If a number of worker processes is given, create an operator, that
+    # aggregates the groups in parallel. Since the parallel aggregations merge
+    # the groups in memory, they do not bound the memory consumption.
+    if workers and key is not None:
+        if buffer_size is not None or max_groups is not None:
+            raise ValueError(
+                "the parameter 'workers' can not be combined with the "
+                "parameters 'buffer_size' and 'max_groups'")
+        return _create_parallel_group_aggregation(
+            *args, key=key, domain=domain, target=target, presorted=presorted,
+            hashed=hashed, workers=workers)
+
+    # If all aggregation functions are accumulators and a grouping key is
+    # given, create an operator, that incrementally aggregates the groups
+    if key is not None and _is_accumulation(*args):
+        return _create_group_accumulation(
+            *args, key=key, domain=domain, target=target, presorted=presorted,
+            hashed=hashed, buffer_size=buffer_size, max_groups=max_groups)
+
     # Create Grouper
     if key is None:
         group = create_grouper() # Trivial grouper
     elif isinstance(key, tuple):
-        group = create_grouper(*key, domain=domain, presorted=presorted)
+        group = create_grouper(
+            *key, domain=domain, presorted=presorted, hashed=hashed,
+            buffer_size=buffer_size)
     elif isinstance(key, Hashable):
-        group = create_grouper(key, domain=domain, presorted=presorted)
+        group = create_grouper(
+            key, domain=domain, presorted=presorted, hashed=hashed,
+            buffer_size=buffer_size)
 
     # Create Aggregator
     contract = create_aggregator(*args, domain=domain, target=target)
 
     # Map Aggregator to Groups
     return lambda seq: map(contract, group(seq))
+
+def _create_group_accumulation(
+        *args: stype.VarLike, key: Key, domain: stype.DomLike = None,
+        target: type = tuple, presorted: bool = False,
+        hashed: bool = False, buffer_size: Optional[int] = None,
+        max_groups: Optional[int] = None) -> SeqOp:
+    # Check for mutually exclusive arguments
+    if presorted and hashed:
+        raise ValueError(
+            "the parameters 'presorted' and 'hashed' are mutually exclusive")
+
+    # Create getter for the grouping key and the accumulation
+    keys = key if isinstance(key, tuple) else (key, )
+    getter = Getter(*keys, domain=domain)
+    accumulation = _Accumulation(*args, domain=domain, target=target)
+
+    # Create an operator, that accumulates the groups within a hash table of the
+    # grouping keys. Note, that dictionaries preserve the insertion order of
+    # their keys, such that the groups are ordered by their first occurrence.
+    if hashed and max_groups is not None:
+        return functools.partial(
+            _accumulate_spilled, accumulation=accumulation, getter=getter,
+            max_groups=max_groups)
+    if hashed:
+        initialize = accumulation.initialize
+        update = accumulation.update
+        def hash_aggregator(seq: Iterable[Any]) -> Iterable[Any]:
+            groups: Dict[Any, list] = {}
+            for obj in seq:
+                group = getter(obj)
+                try:
+                    states = groups[group]
+                except KeyError:
+                    states = groups[group] = initialize()
+                update(states, obj)
+            return map(accumulation.finalize, groups.values())
+        return hash_aggregator
+
+    # Create an operator, that accumulates the blocks of a sorted sequence.
+    # Thereby the blocks are not stored, but passed as iterators to the
+    # accumulation.
+    blocks: SeqOp = lambda seq: map(
+        operator.itemgetter(1), itertools.groupby(seq, key=getter))
+    if presorted:
+        return lambda seq: map(accumulation, blocks(seq))
+    if buffer_size is not None:
+        return lambda seq: map(accumulation, blocks(_sort_external(
+            seq, key=getter, buffer_size=buffer_size)))
+    return lambda seq: map(accumulation, blocks(sorted(seq, key=getter)))
+
+def _accumulate_spilled(
+        seq: Iterable[Any], accumulation: _Accumulation, getter: AnyOp,
+        max_groups: int) -> Iterator[Any]:
+    # Accumulate the groups within a hash table, where any group is represented
+    # by an entry, which comprises the number of its first occurrence and its
+    # partial aggregates. If the hash table exceeds the maximum number of
+    # groups, the entries are spilled to partitions.
+    initialize = accumulation.initialize
+    update = accumulation.update
+    counter = itertools.count()
+    groups: Dict[Any, list] = {}
+    with contextlib.ExitStack() as stack:
+        files: List[Any] = []
+        for obj in seq:
+            group = getter(obj)
+            entry = groups.get(group)
+            if entry is None:
+                if len(groups) >= max_groups:
+                    _spill_groups(groups, files, stack, level=0)
+                entry = groups[group] = [next(counter), initialize()]
+            update(entry[1], obj)
+        entries = _merge_groups(
+            groups, files, stack, merge=accumulation.merge,
+            max_groups=max_groups, level=0)
+        finalize = accumulation.finalize
+        for entry in entries:
+            yield finalize(entry[1])
+
+def _spill_groups(
+        groups: Dict[Any, list], files: List[Any],
+        stack: contextlib.ExitStack, level: int) -> None:
+    # Partition the entries of the hash table by the hash values of the
+    # grouping keys, which are salted by the level of the partitioning, and
+    # append the partitions to temporary files
+    if not files:
+        for _ in range(_SPILL_PARTITIONS):
+            files.append(stack.enter_context(tempfile.TemporaryFile()))
+    partitions: List[list] = [[] for _ in files]
+    for group, entry in groups.items():
+        partitions[hash((level, group)) % len(files)].append((group, entry))
+    for file, partition in zip(files, partitions):
+        if partition:
+            pickle.dump(partition, file, protocol=pickle.HIGHEST_PROTOCOL)
+    groups.clear()
+
+def _merge_groups(
+        groups: Dict[Any, list], files: List[Any],
+        stack: contextlib.ExitStack, merge: AnyOp, max_groups: int,
+        level: int) -> Iterator[list]:
+    # If no entries have been spilled, the entries are ordered in memory
+    first = operator.itemgetter(0)
+    if not files:
+        return iter(sorted(groups.values(), key=first))
+
+    # Merge the entries of the partitions one by one and write the ordered
+    # entries of any partition to a run. Thereupon merge the runs.
+    _spill_groups(groups, files, stack, level=level)
+    runs = []
+    for file in files:
+        entries = _reduce_partition(
+            file, stack, merge=merge, max_groups=max_groups, level=level + 1)
+        run = stack.enter_context(tempfile.TemporaryFile())
+        for block in iter(lambda: list(
+                itertools.islice(entries, _BLOCK_SIZE)), []):
+            pickle.dump(block, run, protocol=pickle.HIGHEST_PROTOCOL)
+        file.close()
+        runs.append(run)
+    return heapq.merge(*map(_read_run, runs), key=first)
+
+def _reduce_partition(
+        file: Any, stack: contextlib.ExitStack, merge: AnyOp,
+        max_groups: int, level: int) -> Iterator[list]:
+    # Merge the entries of a partition by their grouping keys. If the
+    # partition exceeds the maximum number of groups, it is recursively
+    # partitioned, unless the maximum depth is reached.
+    groups: Dict[Any, list] = {}
+    files: List[Any] = []
+    for group, entry in _read_run(file):
+        current = groups.get(group)
+        if current is None:
+            if len(groups) >= max_groups and level < _SPILL_DEPTH:
+                _spill_groups(groups, files, stack, level=level)
+            groups[group] = entry
+        else:
+            current[0] = min(current[0], entry[0])
+            current[1] = merge(current[1], entry[1])
+    return _merge_groups(
+        groups, files, stack, merge=merge, max_groups=max_groups,
+        level=level)
+
+def _create_parallel_group_aggregation(
+        *args: stype.VarLike, key: Key, domain: stype.DomLike = None,
+        target: type = tuple, presorted: bool = False, hashed: bool = False,
+        workers: int = 1) -> SeqOp:
+    # Check for mutually exclusive arguments
+    if presorted and hashed:
+        raise ValueError(
+            "the parameters 'presorted' and 'hashed' are mutually exclusive")
+
+    # Create getter for the grouping key. The aggregates of sorted sequences
+    # are ordered by their keys and otherwise by the first occurrence of their
+    # keys. Note: For presorted sequences both orders are equal.
+    keys = key if isinstance(key, tuple) else (key, )
+    getter = Getter(*keys, domain=domain)
+    ordered = hashed or presorted
+
+    # Create an operator, that accumulates blocks of the sequence to hash
+    # tables of partial states within the worker processes. Thereupon the
+    # partial states are merged in the order of the blocks, which preserves the
+    # order of the first occurrence of the keys.
+    if _is_accumulation(*args):
+        accumulation = _Accumulation(*args, domain=domain, target=target)
+        def accumulate(seq: Iterable[Any]) -> Iterator[Any]:
+            objs = iter(seq)
+            blocks = iter(lambda: list(itertools.islice(objs, _TASK_SIZE)), [])
+            tasks = zip(
+                itertools.repeat(accumulation), itertools.repeat(getter),
+                blocks)
+            groups: Dict[Any, list] = {}
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                for part in _map_tasks(pool, _accumulate_block, tasks, workers):
+                    for group, states in part.items():
+                        if group in groups:
+                            states = accumulation.merge(groups[group], states)
+                        groups[group] = states
+            order = groups if ordered else sorted(groups)
+            return map(accumulation.finalize, map(groups.__getitem__, order))
+        return accumulate
+
+    # Create an operator, that partitions the sequence by the hash values of
+    # the grouping keys, such that any group is contained in a single
+    # partition. Thereupon the partitions are aggregated by hash tables within
+    # the worker processes, which orders the aggregates of any partition by the
+    # first occurrence of their keys.
+    kwds = {'key': key, 'domain': domain, 'target': target, 'hashed': True}
+    def aggregate(seq: Iterable[Any]) -> Iterator[Any]:
+        first: Dict[Any, int] = {}
+        partitions: List[list] = [[] for _ in range(workers)]
+        groups: List[list] = [[] for _ in range(workers)]
+        for obj in seq:
+            group = getter(obj)
+            pos = hash(group) % workers
+            if group not in first:
+                first[group] = len(first)
+                groups[pos].append(group)
+            partitions[pos].append(obj)
+        tasks = zip(
+            itertools.repeat(args), itertools.repeat(kwds), partitions)
+        results = []
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            for pos, part in enumerate(
+                    _map_tasks(pool, _aggregate_partition, tasks, workers)):
+                results += zip(groups[pos], part)
+        sort_key = (lambda item: first[item[0]]) if ordered else (
+            operator.itemgetter(0))
+        return map(operator.itemgetter(1), sorted(results, key=sort_key))
+    return aggregate
+
+def _map_tasks(
+        pool: concurrent.futures.Executor, func: AnyOp,
+        tasks: Iterable[tuple], workers: int) -> Iterator[Any]:
+    # Submit the tasks to the pool and yield their results in order. Thereby
+    # the number of pending tasks is bounded, such that the tasks are lazily
+    # created from the iterable.
+    pending: collections.deque = collections.deque()
+    for task in tasks:
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+        pending.append(pool.submit(func, *task))
+    while pending:
+        yield pending.popleft().result()
+
+def _accumulate_block(
+        accumulation: _Accumulation, getter: AnyOp,
+        block: List[Any]) -> Dict[Any, list]:
+    # Accumulate a block of objects to a hash table of states
+    groups: Dict[Any, list] = {}
+    initialize = accumulation.initialize
+    update = accumulation.update
+    for obj in block:
+        group = getter(obj)
+        try:
+            states = groups[group]
+        except KeyError:
+            states = groups[group] = initialize()
+        update(states, obj)
+    return groups
+
+def _aggregate_partition(
+        args: Tuple[stype.VarLike, ...], kwds: Dict[str, Any],
+        partition: List[Any]) -> List[Any]:
+    # Aggregate a partition by a hashed group aggregator
+    return list(create_group_aggregator(*args, **kwds)(partition))
+
+class GroupAggregator(collections.abc.Iterable):
+    """Incremental group aggregation of growing sequences.
+
+    Group aggregators keep the partial aggregates of the groups within a hash
+    table of the grouping keys, which is updated by appended batches of
+    objects. Thereby the aggregation of a batch only requires time in the order
+    of the batch size and not in the order of all previously appended objects.
+    The partial aggregates can be saved to a file and restored, such that the
+    aggregation can be continued by another process.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`, where the
+            operators are required to be :class:`accumulators <Accumulator>`.
+            Fields without an aggregation function are aggregated by their
+            first value.
+        key: Optional grouping key. If provided, the grouping key can be a
+            :term:`field identifier` or a composite key, given by a tuple of
+            field identifiers. By default all objects are aggregated within a
+            single group.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the aggregated objects. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        target: Optional target type of the aggregates. Supported types are
+            :class:`tuple` and :class:`dict`. By default the aggregates are
+            given as tuples.
+
+    """
+    __slots__ = ['_getter', '_accumulation', '_signature', '_groups']
+
+    _getter: AnyOp
+    _accumulation: _Accumulation
+    _signature: tuple
+    _groups: Dict[Any, list]
+
+    def __init__(
+            self, *args: stype.VarLike, key: Key = None,
+            domain: stype.DomLike = None, target: type = tuple) -> None:
+        if not _is_accumulation(*args):
+            raise ValueError(
+                "the aggregation functions are required to be accumulators")
+        keys = key if isinstance(key, tuple) else (key, )
+        if key is None:
+            self._getter = Zero(tuple)
+        else:
+            self._getter = Getter(*keys, domain=domain)
+        self._accumulation = _Accumulation(
+            *args, domain=domain, target=target)
+
+        # The signature of the grouping key, the domain and the variables
+        # identifies compatible states
+        variables = tuple(
+            (var.name, repr(var.operator), var.frame)
+            for var in _create_variables(*args))
+        self._signature = (
+            keys, repr(stype.create_domain(domain)), variables)
+        self._groups = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._accumulation.finalize, self._groups.values())
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def append(self, seq: Iterable[Any]) -> List[Any]:
+        """Append a batch of objects to the aggregation.
+
+        Args:
+            seq: Iterable of objects within the domain of the aggregator.
+
+        Returns:
+            List with the updated aggregates of the groups, that contain
+            objects of the batch. The aggregates are ordered by the first
+            occurrence of their groups within the batch.
+
+        """
+        getter = self._getter
+        groups = self._groups
+        initialize = self._accumulation.initialize
+        update = self._accumulation.update
+        updated: Dict[Any, list] = {}
+        for obj in seq:
+            group = getter(obj)
+            states = updated.get(group)
+            if states is None:
+                states = groups.get(group)
+                if states is None:
+                    states = groups[group] = initialize()
+                updated[group] = states
+            update(states, obj)
+        return list(map(self._accumulation.finalize, updated.values()))
+
+    def save(self, file: Union[str, os.PathLike, IO[bytes]]) -> None:
+        """Save the partial aggregates to a file.
+
+        Args:
+            file: String or :term:`path-like object`, that points to a writable
+                file in the directory structure of the system, or a
+                :term:`file object` in binary writing mode. If a path is given,
+                the file is replaced atomically, such that an interrupted save
+                does not corrupt previously saved aggregates.
+
+        """
+        state = {'signature': self._signature, 'groups': self._groups}
+        if not isinstance(file, (str, os.PathLike)):
+            pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+            return
+        # Write the aggregates to a temporary file within the same directory,
+        # which is removed, if the aggregates can not be written. Thereupon
+        # set the mode of the replaced file or, if the file does not exist, the
+        # default file mode, given by the umask, and replace the file.
+        path = os.fspath(file)
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def load(self, file: Union[str, os.PathLike, IO[bytes]]) -> None:
+        """Restore the partial aggregates from a file.
+
+        Args:
+            file: String or :term:`path-like object`, that points to a readable
+                file in the directory structure of the system, or a
+                :term:`file object` in binary reading mode. The file is
+                required to be saved by a group aggregator with equal grouping
+                key, domain and variable definitions. Since the aggregates are
+                unpickled, the file is required to be trusted.
+
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, 'rb') as fh:
+                state = pickle.load(fh)
+        else:
+            state = pickle.load(file)
+        if state['signature'] != self._signature:
+            raise ValueError(
+                "the saved aggregates have a different grouping key, domain "
+                "or variable definitions")
+        self._groups = state['groups']
+
+def create_window_aggregator(
+        *args: stype.VarLike, size: int, step: int = 1, key: Key = None,
+        domain: stype.DomLike = None, target: type = tuple) -> SeqOp:
+    """Creates a sliding window aggregation operator.
+
+    Sliding window aggregation operators act on sorted sequences and aggregate
+    the objects within windows of a fixed number of consecutive objects. The
+    aggregates of :class:`invertible accumulators <InvertibleAccumulator>` are
+    updated incrementally by the objects, that enter and leave the window, and
+    the aggregates of :class:`Min` and :class:`Max` by monotonic queues, such
+    that they require constant time per object. All other aggregation
+    functions are evaluated for the objects of each window.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`, where the
+            operators are required to be valid :term:`aggregation functions
+            <aggregation function>`. Fields without an aggregation function are
+            aggregated by their first value within the window.
+        size: Number of consecutive objects within a window.
+        step: Optional number of objects, by which consecutive windows are
+            shifted. By default the windows are shifted by a single object.
+        key: Optional grouping key. If provided, the sequence is required to be
+            sorted by the grouping key and the windows are not allowed to span
+            multiple groups. The grouping key can be a :term:`field identifier`
+            or a composite key, given by a tuple of field identifiers.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        target: Optional target type of the aggregates. Supported types are
+            :class:`tuple` and :class:`dict`. By default the aggregates are
+            given as tuples.
+
+    Returns:
+        Operator, that returns an iterator over the aggregates of the windows.
+        Thereby only windows that comprise the given number of objects are
+        aggregated, starting with the first object of the sequence or group.
+
+    """
+    # Create the window aggregation
+    window = _Window(*args, domain=domain, target=target, size=size, step=step)
+    if key is None:
+        return window
+
+    # Aggregate the windows per block of the sorted sequence
+    keys = key if isinstance(key, tuple) else (key, )
+    getter = Getter(*keys, domain=domain)
+    blocks: SeqOp = lambda seq: map(
+        operator.itemgetter(1), itertools.groupby(seq, key=getter))
+    return lambda seq: itertools.chain.from_iterable(map(window, blocks(seq)))
+
+def create_pivot(
+        row: Key, column: Key, value: FieldID, aggfunc: OptOp = None,
+        domain: stype.DomLike = None, fill: Any = None) -> SeqOp:
+    """Creates a pivot operator, that aggregates a field to a 2-D table.
+
+    Pivot operators act on sequences of objects and aggregate the values of a
+    field by the combinations of a row key and a column key. Thereby the
+    objects are aggregated within a single pass by a hash table of the cells.
+
+    Args:
+        row: Row key of the table. The row key can be a :term:`field
+            identifier` or a composite key, given by a tuple of field
+            identifiers.
+        column: Column key of the table. The column key can be a :term:`field
+            identifier` or a composite key, given by a tuple of field
+            identifiers.
+        value: :term:`Field identifier` of the aggregated field.
+        aggfunc: Optional :term:`aggregation function`. If the aggregation
+            function is an :class:`accumulator <Accumulator>`, the cells are
+            aggregated incrementally, otherwise the values are collected per
+            cell. By default the values are counted by the accumulator
+            :class:`Count`.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        fill: Optional value of the cells, that do not contain any objects. By
+            default the value is None.
+
+    Returns:
+        Operator, that returns the table as a dictionary, that maps the row keys
+        to dictionaries, that map the column keys to the aggregates. Thereby
+        the rows and the columns are ordered by the first occurrence of their
+        keys within the sequence.
+
+    """
+    # Create getters for the row key, the column key and the value
+    rows = row if isinstance(row, tuple) else (row, )
+    cols = column if isinstance(column, tuple) else (column, )
+    get_row = Getter(*rows, domain=domain)
+    get_col = Getter(*cols, domain=domain)
+    get_value = Getter(value, domain=domain)
+
+    # Use the accumulator methods of the aggregation function or otherwise
+    # collect the values of the cells in lists
+    aggfunc = aggfunc or Count()
+    if isinstance(aggfunc, Accumulator):
+        initialize = aggfunc.initialize
+        update = aggfunc.update
+        finalize = aggfunc.finalize
+    else:
+        initialize = list
+        update = lambda state, value: state.append(value) or state
+        finalize = aggfunc
+
+    def pivot(seq: Iterable[Any]) -> Dict[Any, Dict[Any, Any]]:
+        cells: Dict[Tuple[Any, Any], Any] = {}
+        keys: Tuple[Dict[Any, None], Dict[Any, None]] = ({}, {})
+        for obj in seq:
+            cell = (get_row(obj), get_col(obj))
+            try:
+                state = cells[cell]
+            except KeyError:
+                keys[0].setdefault(cell[0])
+                keys[1].setdefault(cell[1])
+                state = initialize()
+            cells[cell] = update(state, get_value(obj))
+        table: Dict[Any, Dict[Any, Any]] = {}
+        for key in keys[0]:
+            table[key] = {
+                col: finalize(cells[key, col]) if (key, col) in cells else fill
+                for col in keys[1]}
+        return table
+    return pivot
+
+def create_rollup(
+        *args: stype.VarLike, keys: Frame, domain: stype.DomLike = None,
+        target: type = tuple) -> SeqOp:
+    """Creates a rollup operator, that aggregates a hierarchy of groups.
+
+    Rollup operators act on sequences of objects and aggregate the groups of
+    any prefix of a hierarchy of grouping keys, including the empty prefix,
+    which aggregates all objects to a grand total. Thereby the objects are
+    grouped within a single pass by a hash table of the finest groups and the
+    aggregates of the coarser groups are obtained by merging the partial
+    aggregates of their subgroups.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`, where the
+            operators are required to be valid :term:`aggregation functions
+            <aggregation function>`. Fields without an aggregation function are
+            aggregated by their first value. If such a field is a grouping key,
+            its value is None within the aggregates of groups, that do not
+            comprise the grouping key. If all aggregation functions are
+            :class:`accumulators <Accumulator>`, the finest groups are
+            aggregated incrementally and the partial aggregates are merged,
+            otherwise the objects of the groups are collected.
+        keys: Hierarchy of grouping keys, given by a non-empty tuple of
+            :term:`field identifiers <field identifier>` in descending order.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        target: Optional target type of the aggregates. Supported types are
+            :class:`tuple` and :class:`dict`. By default the aggregates are
+            given as tuples.
+
+    Returns:
+        Operator, that returns an iterator over the aggregates of the groups.
+        The groups are ordered hierarchically by the first occurrence of their
+        keys within the sequence, where the aggregates of the subgroups precede
+        the aggregate of their group and the grand total is the last aggregate.
+
+    """
+    if target not in (tuple, dict):
+        raise ValueError(f"type '{target.__name__}' is not supported")
+    if not keys:
+        raise ValueError("at least one grouping key is required")
+
+    # Create a getter for the grouping keys and get the positions of the
+    # grouping keys within the aggregates, which are not aggregated
+    getter = Getter(*keys, domain=domain, target=tuple)
+    variables = _create_variables(*args)
+    components = tuple(var.name for var in variables)
+    nulls: List[List[int]] = [[] for _ in range(len(keys) + 1)]
+    for pos, var in enumerate(variables):
+        if var.name not in keys or var.frame != (var.name, ):
+            continue
+        if isinstance(var.operator, First):
+            for level in range(keys.index(var.name) + 1):
+                nulls[level].append(pos)
+
+    # Use the methods of the accumulation or otherwise collect the objects
+    if _is_accumulation(*args):
+        accumulation = _Accumulation(*args, domain=domain)
+        initialize = accumulation.initialize
+        update = accumulation.update
+        merge = accumulation.merge
+        finalize = accumulation.finalize
+    else:
+        initialize = list
+        update = list.append
+        merge = operator.add
+        finalize = create_aggregator(*args, domain=domain)
+
+    def aggregate(states: Any, level: int) -> Any:
+        values = finalize(states)
+        if len(components) == 1:
+            values = (values, )
+        if nulls[level]:
+            values = list(values)
+            for pos in nulls[level]:
+                values[pos] = None
+        if target == dict:
+            return dict(zip(components, values))
+        if len(components) == 1:
+            return values[0]
+        return tuple(values)
+
+    def rollup(seq: Iterable[Any]) -> Iterator[Any]:
+        # Aggregate the finest groups within a hash table
+        groups: Dict[Any, Any] = {}
+        for obj in seq:
+            group = getter(obj)
+            states = groups.get(group)
+            if states is None:
+                states = groups[group] = initialize()
+            update(states, obj)
+
+        # Insert the finest groups into a tree of the key prefixes, which
+        # preserves the order of their first occurrence
+        tree: Dict[Any, Any] = {}
+        for group, states in groups.items():
+            node = tree
+            for value in group[:-1]:
+                node = node.setdefault(value, {})
+            node[group[-1]] = states
+
+        # Aggregate the groups of the tree in post-order and merge the partial
+        # aggregates upwards
+        results: List[Any] = []
+        def traverse(node: Any, level: int) -> Any:
+            if level == len(keys):
+                results.append(aggregate(node, level))
+                return node
+            states = initialize()
+            for child in node.values():
+                states = merge(states, traverse(child, level + 1))
+            results.append(aggregate(states, level))
+            return states
+        if groups:
+            traverse(tree, 0)
+        return iter(results)
+
+    return rollup
+
+def create_join(
+        left: Key, right: Key = None, how: str = 'inner',
+        domain: stype.DomLike = None, right_domain: stype.DomLike = None,
+        target: stype.DomLike = None, presorted: bool = False) -> AnyOp:
+    """Create a join operator with fixed join keys.
+
+    Join operators act on two sequences of objects and combine the objects of
+    the left and the right sequence, which are equal with respect to their join
+    keys, to pairs.
+
+    Args:
+        left: Join key of the left sequence. The join key can be a
+            :term:`field identifier` or a composite key, given by a tuple of
+            field identifiers.
+        right: Optional join key of the right sequence. By default the join key
+            of the left sequence is used.
+        how: Optional type of the join. For 'inner', only pairs of objects
+            with equal keys are returned. For 'left', also the objects of the
+            left sequence without a matching key are returned, paired with None.
+            For 'outer', additionally the objects of the right sequence
+            without a matching key are returned, paired with None. The default
+            join type is 'inner'.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the objects within the left sequence.
+            The accepted parameter values are documented in the class
+            :class:`Getter`.
+        right_domain: Optional :term:`domain like` parameter, that specifies
+            the type and (if required) the frame of the objects within the right
+            sequence. By default the domain of the left sequence is used.
+        target: Optional :term:`domain like` parameter, that specifies the
+            type of the returned pairs, which have the frame ('left', 'right').
+            Supported types are :class:`tuple`, :class:`list` and
+            :class:`dict`. By default the pairs are returned as tuples.
+        presorted: Optional boolean parameter. If set to True, both sequences
+            are required to be sorted by their join keys and are joined by a
+            single pass over both sequences, which only requires memory for the
+            objects, that share the current key. By default the right sequence
+            is stored in a hash table of its join keys, which is probed by the
+            objects of the left sequence. In this case the join keys are
+            required to be hashable and the unmatched objects of the right
+            sequence are returned after the pairs of the left sequence.
+
+    Returns:
+        Operator, that takes a left and a right sequence and returns an
+        iterator over the joined pairs.
+
+    """
+    # Check join type
+    if how not in ['inner', 'left', 'outer']:
+        raise ValueError(f"join type '{how}' is not supported")
+    keep_left = how in ['left', 'outer']
+    keep_right = how == 'outer'
+
+    # Create getters for the join keys and the formatter of the pairs
+    lkeys = left if isinstance(left, tuple) else (left, )
+    rkeys = lkeys if right is None else (
+        right if isinstance(right, tuple) else (right, ))
+    if right_domain is None:
+        right_domain = domain
+    lgetter = Getter(*lkeys, domain=domain)
+    rgetter = Getter(*rkeys, domain=right_domain)
+    pairs = (tuple, ('left', 'right'))
+    formatter = None if target is None else Getter(
+        'left', 'right', domain=pairs, target=target)
+
+    # Create an operator, that joins sorted sequences by merging the blocks of
+    # equal keys
+    if presorted:
+        def join(lseq: Iterable[Any], rseq: Iterable[Any]) -> Iterator[Any]:
+            lblocks = itertools.groupby(lseq, key=lgetter)
+            rblocks = itertools.groupby(rseq, key=rgetter)
+            lnext = next(lblocks, None)
+            rnext = next(rblocks, None)
+            while lnext is not None and rnext is not None:
+                lkey, lblock = lnext
+                rkey, rblock = rnext
+                if lkey < rkey:
+                    if keep_left:
+                        yield from zip(lblock, itertools.repeat(None))
+                    lnext = next(lblocks, None)
+                elif rkey < lkey:
+                    if keep_right:
+                        yield from zip(itertools.repeat(None), rblock)
+                    rnext = next(rblocks, None)
+                else:
+                    matches = list(rblock)
+                    for obj in lblock:
+                        yield from zip(itertools.repeat(obj), matches)
+                    lnext = next(lblocks, None)
+                    rnext = next(rblocks, None)
+            if keep_left and lnext is not None:
+                for _, lblock in itertools.chain([lnext], lblocks):
+                    yield from zip(lblock, itertools.repeat(None))
+            if keep_right and rnext is not None:
+                for _, rblock in itertools.chain([rnext], rblocks):
+                    yield from zip(itertools.repeat(None), rblock)
+
+    # Create an operator, that builds a hash table of the right sequence and
+    # probes the hash table by the objects of the left sequence
+    else:
+        def join(lseq: Iterable[Any], rseq: Iterable[Any]) -> Iterator[Any]:
+            table: Dict[Any, list] = collections.defaultdict(list)
+            for obj in rseq:
+                table[rgetter(obj)].append(obj)
+            matched: set = set()
+            for obj in lseq:
+                key = lgetter(obj)
+                matches = table.get(key)
+                if matches:
+                    yield from zip(itertools.repeat(obj), matches)
+                    if keep_right:
+                        matched.add(key)
+                elif keep_left:
+                    yield obj, None
+            if keep_right:
+                for key, matches in table.items():
+                    if key not in matched:
+                        yield from zip(itertools.repeat(None), matches)
+
+    if formatter is None:
+        return join
+    return lambda lseq, rseq: map(formatter, join(lseq, rseq))
+
+#
+# Query Pipelines
+#
+
+class Pipeline:
+    """Lazy query pipeline over sequences of objects.
+
+    Pipelines are built by chaining the methods :meth:`where`, :meth:`select`,
+    :meth:`groupby`, :meth:`agg`, :meth:`orderby` and :meth:`limit`, where any
+    method returns a new pipeline, that extends the stages of the original
+    pipeline. The stages are not evaluated before the pipeline is applied to a
+    sequence. Thereupon the stages are planned once: Consecutive selections and
+    projections are fused into a single generated function per object, groups
+    are aggregated within a hash table, unless the aggregates are subsequently
+    ordered by their grouping keys, in which case the groups are created by
+    sorting, and orderings, which are followed by a limit, select the objects
+    by a heap. The results are streamed, such that intermediate sequences are
+    only stored by stages, which require them.
+
+    Args:
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the pipeline's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        target: Optional target type of the projected objects. Supported types
+            are :class:`tuple` and :class:`dict`. Objects, which are neither
+            projected by :meth:`select` nor by :meth:`agg`, are returned
+            unchanged. By default the target type is tuple.
+
+    """
+    __slots__ = ['_domain', '_target', '_stages', '_plan']
+
+    _domain: stype.Domain
+    _target: type
+    _stages: Tuple[Tuple[str, tuple, dict], ...]
+    _plan: Optional[List[SeqOp]]
+
+    def __init__(
+            self, domain: stype.DomLike = None, target: type = tuple) -> None:
+        if target not in (tuple, dict):
+            raise ValueError(f"type '{target.__name__}' is not supported")
+        self._domain = stype.create_domain(domain)
+        self._target = target
+        self._stages = tuple()
+        self._plan = None
+
+    def __call__(self, seq: Iterable[Any]) -> Iterator[Any]:
+        if self._plan is None:
+            self._plan = self._create_plan()
+        for op in self._plan:
+            seq = op(seq)
+        return iter(seq)
+
+    def __repr__(self) -> str:
+        name = type(self).__name__
+        stages = ''.join(f'.{stage[0]}()' for stage in self._stages)
+        return f"{name}(){stages}"
+
+    def where(self, expression: str) -> 'Pipeline':
+        """Select the objects, that satisfy a predicate.
+
+        Args:
+            expression: Predicate, given as an expression, which is parsed and
+                compiled like the expression of a :class:`Lambda` operator. The
+                variables of the expression are required to be valid
+                :term:`field identifiers <field identifier>` for the objects of
+                the preceding stage.
+
+        Returns:
+            New pipeline, that extends the stages by the selection.
+
+        """
+        return self._extend('where', expression)
+
+    def select(self, *args: stype.VarLike) -> 'Pipeline':
+        """Project the objects to variables.
+
+        Args:
+            *args: :term:`Variable definitions<variable definition>`, as
+                documented in the class :class:`Vector`. The fields of the
+                variables refer to the objects of the preceding stage.
+
+        Returns:
+            New pipeline, that extends the stages by the projection.
+
+        """
+        return self._extend('select', *args)
+
+    def groupby(self, *args: FieldID) -> 'Pipeline':
+        """Group the objects by grouping keys.
+
+        Args:
+            *args: *Grouping keys*, given by :term:`field identifiers <field
+                identifier>` for the objects of the preceding stage. The
+                grouping is required to be followed by an aggregation.
+
+        Returns:
+            New pipeline, that extends the stages by the grouping.
+
+        """
+        return self._extend('groupby', *args)
+
+    def agg(self, *args: stype.VarLike) -> 'Pipeline':
+        """Aggregate the groups of the preceding grouping or all objects.
+
+        Args:
+            *args: :term:`Variable definitions<variable definition>`, where the
+                operators are required to be valid :term:`aggregation functions
+                <aggregation function>`, as documented in the function
+                :func:`create_aggregator`.
+
+        Returns:
+            New pipeline, that extends the stages by the aggregation.
+
+        """
+        return self._extend('agg', *args)
+
+    def orderby(self, *args: FieldID, reverse: bool = False) -> 'Pipeline':
+        """Order the objects by sorting keys.
+
+        Args:
+            *args: *Sorting keys*, given by :term:`field identifiers <field
+                identifier>` for the objects of the preceding stage.
+            reverse: Optional boolean parameter. If set to True, then the
+                objects are sorted as if each comparison were reversed.
+
+        Returns:
+            New pipeline, that extends the stages by the ordering.
+
+        """
+        return self._extend('orderby', *args, reverse=reverse)
+
+    def limit(self, n: int) -> 'Pipeline':
+        """Limit the number of objects.
+
+        Args:
+            n: Maximum number of returned objects.
+
+        Returns:
+            New pipeline, that extends the stages by the limit.
+
+        """
+        return self._extend('limit', n)
+
+    def _extend(self, name: str, *args: Any, **kwds: Any) -> 'Pipeline':
+        # Create a new pipeline with an additional stage
+        pipeline = Pipeline(domain=self._domain, target=self._target)
+        pipeline._stages = self._stages + ((name, args, kwds), )
+        return pipeline
+
+    def _create_plan(self) -> List[SeqOp]:
+        # Create a list of sequence operators, which are applied consecutively
+        plan: List[SeqOp] = []
+        stages = self._stages
+        dom = self._domain
+        pos = 0
+        while pos < len(stages):
+            name, args, kwds = stages[pos]
+            follow = stages[pos + 1] if pos + 1 < len(stages) else None
+
+            # Fuse consecutive selections and projections
+            if name in ('where', 'select'):
+                end = pos + 1
+                while end < len(stages) and stages[end][0] in (
+                        'where', 'select'):
+                    end += 1
+                op, dom = _fuse_stages(stages[pos:end], dom, self._target)
+                plan.append(op)
+                pos = end
+
+            # Aggregate the groups by a hash table, or if the aggregates are
+            # subsequently ordered by their grouping keys, by sorting, which
+            # makes the ordering obsolete
+            elif name == 'groupby':
+                if not follow or follow[0] != 'agg':
+                    raise ValueError(
+                        "a grouping requires a subsequent aggregation")
+                variables = _create_variables(*follow[1])
+                after = stages[pos + 2] if pos + 2 < len(stages) else None
+                presort = bool(
+                    after and after[0] == 'orderby' and after[1] == args
+                    and not after[2]['reverse']
+                    and all(any(
+                        var.name == key and var.frame == (key, )
+                        and isinstance(var.operator, First)
+                        for var in variables) for key in args))
+                key = args if len(args) > 1 else args[0]
+                plan.append(create_group_aggregator(
+                    *follow[1], key=key, domain=dom, target=self._target,
+                    hashed=not presort))
+                dom = _get_aggregate_domain(variables, self._target)
+                pos += 3 if presort else 2
+
+            # Aggregate all objects
+            elif name == 'agg':
+                plan.append(create_group_aggregator(
+                    *args, domain=dom, target=self._target))
+                dom = _get_aggregate_domain(
+                    _create_variables(*args), self._target)
+                pos += 1
+
+            # Order the objects. If the ordering is followed by a limit, the
+            # objects are selected by a heap
+            elif name == 'orderby':
+                limit = None
+                if follow and follow[0] == 'limit':
+                    limit = follow[1][0]
+                plan.append(create_sorter(
+                    *args, domain=dom, reverse=kwds['reverse'], limit=limit))
+                pos += 1 if limit is None else 2
+
+            elif name == 'limit':
+                plan.append(functools.partial(_slice, stop=args[0]))
+                pos += 1
+
+        return plan
+
+def _get_aggregate_domain(
+        variables: Tuple[stype.Variable, ...], target: type) -> stype.Domain:
+    # Get the domain of the aggregates, where the aggregates of single variables
+    # are given as scalars
+    frame = tuple(var.name for var in variables)
+    if target == tuple and len(frame) == 1:
+        return stype.create_domain((None, frame))
+    return stype.create_domain((target, frame))
+
+def _fuse_stages(
+        stages: Sequence[Tuple[str, tuple, dict]], domain: stype.Domain,
+        target: type) -> Tuple[SeqOp, stype.Domain]:
+    # Generate a single function, which fetches the fields of an object and
+    # consecutively evaluates the predicates and the projections. Thereby the
+    # components of the projections are represented by expressions, which are
+    # only assigned to local variables, if they are referenced by subsequent
+    # stages. If the object does not satisfy a predicate, the function returns
+    # the sentinel _MISSING.
+    builder = _FunctionBuilder(domain)
+    fields: Optional[Dict[FieldID, ast.expr]] = None
+
+    def fetch(*args: FieldID) -> Tuple[str, ...]:
+        if fields is None:
+            return builder.fetch(*args)
+        names = []
+        for field in args:
+            if field not in fields:
+                raise ValueError(f"field '{field}' is not projected")
+            expr = fields[field]
+            if not isinstance(expr, ast.Name):
+                expr = ast.Name(id=builder.assign(expr), ctx=ast.Load())
+                fields[field] = expr
+            names.append(expr.id)
+        return tuple(names)
+
+    select = False
+    for name, args, _ in stages:
+        if name == 'where':
+            frame = domain.frame if fields is None else tuple(fields)
+            origin = tuple(parser.parse(args[0], variables=frame).origin)
+            op = Lambda(args[0], domain=(None, origin))
+            builder.guard(builder.apply(op, *fetch(*origin)), _MISSING)
+            select = True
+        else:
+            projection: Dict[FieldID, ast.expr] = {}
+            for var in map(stype.create_variable, args):
+                names = fetch(*var.frame)
+                projection[var.name] = builder.apply(var.operator, *names)
+            fields = projection
+
+    # Return the unchanged objects or their projections in the target type
+    if fields is None and domain.type == NoneType:
+        expr = ast.parse('args[0]', mode='eval').body
+    elif fields is None:
+        expr = ast.Name(id='obj', ctx=ast.Load())
+    else:
+        domain = stype.create_domain((target, tuple(fields)))
+        expr = builder.pack(list(fields.values()), target=domain)
+    func = builder.build(expr)
+    if not select:
+        return functools.partial(map, func), domain
+    accept = functools.partial(operator.is_not, _MISSING)
+    return lambda seq: filter(accept, map(func, seq)), domain
+
+def _slice(seq: Iterable[Any], stop: int) -> Iterator[Any]:
+    return itertools.islice(seq, stop)
+
+#
+# Indices of Sequences
+#
+
+class Index(collections.abc.Sized):
+    """Abstract Base Class for indices over sequences of objects.
+
+    Indices store objects of a given domain by their keys, which allows the
+    retrieval of the objects by their keys without a scan of the sequence.
+
+    Args:
+        *args: *Index keys*, which are used to index objects of given domain
+            type. Any index key is required to be a valid :term:`field
+            identifier` for the domain type. If a single index key is given,
+            the objects are indexed by its values, otherwise by tuples of
+            values.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the indexed objects. The accepted
+            parameter values are documented in the class :class:`Getter`.
+
+    """
+    __slots__: StrList = ['_getter']
+
+    _getter: AnyOp
+
+    def __init__(self, *args: FieldID, domain: stype.DomLike = None) -> None:
+        if not args:
+            raise ValueError("at least one index key is required")
+        self._getter = Getter(*args, domain=domain)
+
+    def update(self, seq: Iterable[Any]) -> None:
+        """Insert objects into the index.
+
+        Args:
+            seq: Iterable of objects of the domain type
+
+        """
+        for obj in seq:
+            self.insert(obj)
+
+    @abc.abstractmethod
+    def insert(self, obj: Any) -> None:
+        """Insert an object into the index.
+
+        Args:
+            obj: Object of the domain type
+
+        """
+        raise NotImplementedError(
+            f"'{type(self).__name__}' is required "
+            "to implement a method 'insert'")
+
+    @abc.abstractmethod
+    def get(self, key: Any) -> List[Any]:
+        """Get the objects with a given key.
+
+        Args:
+            key: Value of the index key, or for multiple index keys a tuple of
+                values.
+
+        Returns:
+            List of objects with the given key, in the order of their insertion.
+
+        """
+        raise NotImplementedError(
+            f"'{type(self).__name__}' is required "
+            "to implement a method 'get'")
+
+class HashIndex(Index):
+    """Index, that stores the objects within a hash table of their keys.
+
+    Hash indices answer point queries in constant time. Thereby the keys are
+    required to be hashable.
+
+    """
+    __slots__: StrList = ['_table', '_size']
+
+    _table: Dict[Any, list]
+    _size: int
+
+    def __init__(self, *args: FieldID, domain: stype.DomLike = None) -> None:
+        super().__init__(*args, domain=domain)
+        self._table = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._table
+
+    def insert(self, obj: Any) -> None:
+        key = self._getter(obj)
+        try:
+            self._table[key].append(obj)
+        except KeyError:
+            self._table[key] = [obj]
+        self._size += 1
+
+    def get(self, key: Any) -> List[Any]:
+        return list(self._table.get(key, ()))
+
+class SortedIndex(Index):
+    """Index, that stores the objects ordered by their keys.
+
+    Sorted indices answer point queries and range queries by a binary search in
+    logarithmic time. Thereby the keys are required to be comparable.
+
+    """
+    __slots__: StrList = ['_keys', '_objs']
+
+    _keys: List[Any]
+    _objs: List[Any]
+
+    def __init__(self, *args: FieldID, domain: stype.DomLike = None) -> None:
+        super().__init__(*args, domain=domain)
+        self._keys = []
+        self._objs = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        pos = bisect.bisect_left(self._keys, key)
+        return pos < len(self._keys) and self._keys[pos] == key
+
+    def update(self, seq: Iterable[Any]) -> None:
+        # Insert the objects at once by a stable sort of the new and the
+        # already indexed objects, which is linear for presorted sequences
+        getter = self._getter
+        items = list(zip(self._keys, self._objs))
+        items += [(getter(obj), obj) for obj in seq]
+        items.sort(key=operator.itemgetter(0))
+        self._keys = [key for key, _ in items]
+        self._objs = [obj for _, obj in items]
+
+    def insert(self, obj: Any) -> None:
+        key = self._getter(obj)
+        pos = bisect.bisect_right(self._keys, key)
+        self._keys.insert(pos, key)
+        self._objs.insert(pos, obj)
+
+    def get(self, key: Any) -> List[Any]:
+        start = bisect.bisect_left(self._keys, key)
+        stop = bisect.bisect_right(self._keys, key, lo=start)
+        return self._objs[start:stop]
+
+    def between(self, lower: Any = None, upper: Any = None) -> List[Any]:
+        """Get the objects with keys within a closed interval.
+
+        Args:
+            lower: Optional lower bound of the keys. By default the interval is
+                not bounded from below.
+            upper: Optional upper bound of the keys. By default the interval is
+                not bounded from above.
+
+        Returns:
+            List of objects with keys within the interval, ordered by their
+            keys and for equal keys in the order of their insertion.
+
+        """
+        start = 0 if lower is None else bisect.bisect_left(self._keys, lower)
+        if upper is None:
+            return self._objs[start:]
+        stop = bisect.bisect_right(self._keys, upper, lo=start)
+        return self._objs[start:stop]
+
+def create_index(
+        seq: Iterable[Any], *args: FieldID, kind: str = 'hash',
+        domain: stype.DomLike = None) -> Index:
+    """Create an index over a sequence of objects.
+
+    Args:
+        seq: Iterable of objects of the domain type, which are inserted into
+            the index.
+        *args: *Index keys*, which are used to index objects of given domain
+            type. Any index key is required to be a valid :term:`field
+            identifier` for the domain type.
+        kind: Optional kind of the index. For 'hash' a :class:`HashIndex` and
+            for 'sorted' a :class:`SortedIndex` is created. The default kind is
+            'hash'.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the indexed objects. The accepted
+            parameter values are documented in the class :class:`Getter`.
+
+    Returns:
+        Index over the given objects, which allows the insertion of further
+        objects.
+
+    """
+    index: Index
+    if kind == 'hash':
+        index = HashIndex(*args, domain=domain)
+    elif kind == 'sorted':
+        index = SortedIndex(*args, domain=domain)
+    else:
+        raise ValueError(f"index kind '{kind}' is not supported")
+    index.update(seq)
+    return index
+
+#
+# Parallel evaluation of Operators
+#
+
+def parallel_map(
+        op: AnyOp, seq: Iterable[Any], workers: Optional[int] = None,
+        chunksize: Optional[int] = None) -> List[Any]:
+    """Evaluate an operator for a sequence of objects within worker processes.
+
+    The operator is pickled by its creation arguments and rebuilt within the
+    worker processes. Thereby the operator is required to be picklable, which
+    holds for operators, that are created from picklable arguments.
+
+    Args:
+        op: Picklable callable, e.g. a :class:`Getter`, :class:`Lambda` or
+            :class:`Vector` operator, that is created from picklable
+            arguments.
+        seq: Iterable of objects within the domain of the operator.
+        workers: Maximum number of worker processes. By default the number of
+            processors of the machine is used.
+        chunksize: Number of objects, that are sent to the worker processes
+            per task. By default the objects are evenly distributed in four
+            chunks per worker process.
+
+    Returns:
+        List with the results of the operator in the order of the given
+        objects.
+
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        objs = seq if isinstance(seq, collections.abc.Sized) else list(seq)
+        chunksize = max(1, -(-len(objs) // (4 * workers)))
+        seq = objs
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(op, seq, chunksize=chunksize))
+
+#
+# Asynchronous evaluation of Operators
+#
+
+def create_async_filter(
+        expression: str, domain: stype.DomLike = None) -> AsyncSeqOp:
+    """Create a filter for asynchronous iterators.
+
+    Args:
+        expression: Predicate, given as an expression, which is parsed and
+            compiled like the expression of a :class:`Lambda` operator. The
+            variables of the expression are required to be valid :term:`field
+            identifiers <field identifier>` for the domain type.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+
+    Returns:
+        Callable function which takes an asynchronous iterable of objects of a
+        given domain and returns an asynchronous iterator over the objects,
+        that satisfy the predicate.
+
+    """
+    predicate = Lambda(expression, domain=domain)
+
+    async def select(aseq: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        async for obj in aseq:
+            if predicate(obj):
+                yield obj
+    return select
+
+def create_async_mapper(
+        op: AnyOp, executor: Optional[concurrent.futures.Executor] = None,
+        chunksize: int = 1, max_pending: int = 16) -> AsyncSeqOp:
+    """Create a mapper of an operator over asynchronous iterators.
+
+    Args:
+        op: Callable, e.g. a :class:`Lambda` or :class:`Vector` operator,
+            which is applied to the objects.
+        executor: Optional :class:`executor <concurrent.futures.Executor>`. If
+            provided, the operator is evaluated within the executor, such that
+            CPU-heavy operators do not block the event loop. Thereby the
+            objects are sent to the executor in chunks and the number of
+            pending chunks is limited, such that no further objects are
+            requested from the asynchronous iterable, until the oldest pending
+            chunk is completed. For a :class:`process pool executor
+            <concurrent.futures.ProcessPoolExecutor>` the operator and the
+            objects are required to be picklable. By default the operator is
+            evaluated within the event loop.
+        chunksize: Number of objects, that are sent to the executor per task.
+            By default any object is sent separately.
+        max_pending: Maximum number of chunks, which are concurrently
+            evaluated within the executor. The default number is 16.
+
+    Returns:
+        Callable function which takes an asynchronous iterable of objects and
+        returns an asynchronous iterator over the results of the operator in
+        the order of the given objects.
+
+    """
+    if executor is None:
+        async def mapper(aseq: AsyncIterable[Any]) -> AsyncIterator[Any]:
+            async for obj in aseq:
+                yield op(obj)
+        return mapper
+
+    async def offload(aseq: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        pending: collections.deque = collections.deque()
+        submit: AnyOp = lambda chunk: pending.append(
+            loop.run_in_executor(executor, _map_chunk, op, chunk))
+        try:
+            chunk = []
+            async for obj in aseq:
+                chunk.append(obj)
+                if len(chunk) < chunksize:
+                    continue
+                submit(chunk)
+                chunk = []
+
+                # Yield the results of the completed chunks in the order of
+                # their submission and wait for the oldest chunk, if the
+                # maximum number of pending chunks is reached
+                while pending and (
+                        len(pending) >= max_pending or pending[0].done()):
+                    for result in await pending.popleft():
+                        yield result
+            if chunk:
+                submit(chunk)
+            while pending:
+                for result in await pending.popleft():
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+    return offload
+
+def _map_chunk(op: AnyOp, chunk: List[Any]) -> List[Any]:
+    # Evaluate an operator for a chunk of objects within an executor
+    return list(map(op, chunk))
+
+def create_async_group_aggregator(
+        *args: stype.VarLike, key: Key = None, domain: stype.DomLike = None,
+        target: type = tuple, presorted: bool = False) -> AsyncSeqOp:
+    """Creates a group aggregation operator for asynchronous iterators.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`, where the
+            operators are required to be valid :term:`aggregation functions
+            <aggregation function>`. Fields without an aggregation function are
+            aggregated by their first value. If all aggregation functions are
+            :class:`accumulators <Accumulator>`, the objects are aggregated
+            incrementally, otherwise the objects of the groups are collected.
+        key: Optional grouping key. If provided, the grouping key can be a
+            :term:`field identifier` or a composite key, given by a tuple of
+            field identifiers. By default all objects are aggregated within a
+            single group.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        target: Optional target type of the aggregates. Supported types are
+            :class:`tuple` and :class:`dict`. By default the aggregates are
+            given as tuples.
+        presorted: Optional boolean parameter. If set to True, the objects are
+            required to arrive sorted by the grouping key and the aggregate of
+            a group is returned, as soon as the first object of the next group
+            arrives. Otherwise the groups are aggregated within a hash table of
+            the grouping keys and the aggregates are returned in the order of
+            the first occurrence of their groups, after the asynchronous
+            iterable is exhausted. By default the objects are not assumed to be
+            presorted.
+
+    Returns:
+        Callable function which takes an asynchronous iterable of objects of a
+        given domain and returns an asynchronous iterator over the aggregates
+        of the groups.
+
+    """
+    # Create a getter for the grouping key
+    if key is None:
+        getter: AnyOp = Zero(tuple)
+    else:
+        keys = key if isinstance(key, tuple) else (key, )
+        getter = Getter(*keys, domain=domain)
+
+    # Use the methods of the accumulation or otherwise collect the objects
+    if _is_accumulation(*args):
+        accumulation = _Accumulation(*args, domain=domain, target=target)
+        initialize = accumulation.initialize
+        update = accumulation.update
+        finalize = accumulation.finalize
+    else:
+        initialize = list
+        update = list.append
+        finalize = create_aggregator(*args, domain=domain, target=target)
+
+    # Create an operator, that aggregates the blocks of a sorted iterable
+    if presorted:
+        async def aggregate(aseq: AsyncIterable[Any]) -> AsyncIterator[Any]:
+            current: Any = _MISSING
+            states = None
+            async for obj in aseq:
+                group = getter(obj)
+                if group != current:
+                    if states is not None:
+                        yield finalize(states)
+                    current, states = group, initialize()
+                update(states, obj)
+            if states is not None:
+                yield finalize(states)
+        return aggregate
+
+    # Create an operator, that aggregates the groups within a hash table
+    async def hash_aggregate(aseq: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        groups: Dict[Any, Any] = {}
+        async for obj in aseq:
+            group = getter(obj)
+            states = groups.get(group)
+            if states is None:
+                states = groups[group] = initialize()
+            update(states, obj)
+        for states in groups.values():
+            yield finalize(states)
+    return hash_aggregate
+
+def create_async_window_aggregator(
+        *args: stype.VarLike, size: int, step: int = 1, key: Key = None,
+        domain: stype.DomLike = None, target: type = tuple) -> AsyncSeqOp:
+    """Creates a sliding window aggregation operator for asynchronous iterators.
+
+    The windows are aggregated as documented in the function
+    :func:`create_window_aggregator`, where the aggregate of a window is
+    returned, as soon as the last object of the window arrives.
+
+    Args:
+        *args: :term:`Variable definitions<variable definition>`, where the
+            operators are required to be valid :term:`aggregation functions
+            <aggregation function>`. Fields without an aggregation function are
+            aggregated by their first value within the window.
+        size: Number of consecutive objects within a window.
+        step: Optional number of objects, by which consecutive windows are
+            shifted. By default the windows are shifted by a single object.
+        key: Optional grouping key. If provided, the objects are required to
+            arrive sorted by the grouping key and the windows are not allowed
+            to span multiple groups. The grouping key can be a :term:`field
+            identifier` or a composite key, given by a tuple of field
+            identifiers.
+        domain: Optional :term:`domain like` parameter, that specifies the type
+            and (if required) the frame of the operator's domain. The accepted
+            parameter values are documented in the class :class:`Getter`.
+        target: Optional target type of the aggregates. Supported types are
+            :class:`tuple` and :class:`dict`. By default the aggregates are
+            given as tuples.
+
+    Returns:
+        Callable function which takes an asynchronous iterable of objects of a
+        given domain and returns an asynchronous iterator over the aggregates
+        of the windows.
+
+    """
+    window = _Window(*args, domain=domain, target=target, size=size, step=step)
+    getter: OptOp = None
+    if key is not None:
+        keys = key if isinstance(key, tuple) else (key, )
+        getter = Getter(*keys, domain=domain)
+
+    async def aggregate(aseq: AsyncIterable[Any]) -> AsyncIterator[Any]:
+        slide = window.slide()
+        current: Any = _MISSING
+        async for obj in aseq:
+            if getter is not None:
+                group = getter(obj)
+                if group != current:
+                    if current is not _MISSING:
+                        slide = window.slide()
+                    current = group
+            result = slide.send(obj)
+            if result is not _MISSING:
+                yield result
+    return aggregate
@@ -413,6 +413,21 @@ class Expression:
         if not compile:
             return self.eval
 
+        # Create lambda term
+        string, glob = self.as_term()
+        term = f"lambda {','.join(self.variables)}:{string}"
+        return eval(term, glob) # pylint: disable=W0123
+
+    def as_term(self) -> Tuple[str, dict]:
+        """Get Python term of the expression and its global namespace.
+
+        Returns:
+            Pair, which comprises the expression as a string, that can be
+            evaluated by the Python interpreter and a dictionary, that contains
+            the global names, which are used within the string, with exception
+            of the variables.
+
+        """
         # Get a string representation of the expression, which replaces all not
         # builtin operators by surrogate functions.
         tran = self._get_tran()
@@ -435,9 +450,7 @@ class Expression:
                 else:
                     glob[sur] = sym.value
 
-        # Create lambda term
-        term = f"lambda {','.join(self.variables)}:{string}"
-        return eval(term, glob) # pylint: disable=W0123
+        return string, glob
 
     def as_string(self, translate: Optional[dict] = None) -> str:
         """ """
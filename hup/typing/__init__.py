@@ -26,7 +26,8 @@ __authors__ = ['Patrick Michl <patrick.michl@frootlab.org>']
 
 import os
 import types
-from typing import Any, Callable, ClassVar, Dict, Hashable, IO, Iterable
+from typing import Any, AsyncIterable, AsyncIterator, Callable, ClassVar, Dict
+from typing import Hashable, IO, Iterable
 from typing import Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 from typing import Type, TypeVar, Union, Container, Sized, Generic
 
@@ -137,6 +138,7 @@ Void = Callable[..., None]
 KeyOp = Callable[[Any, Any], bool]
 SeqOp = Callable[[Sequence[Any]], Any]
 SeqHom = Callable[[Sequence[Any]], Sequence[Any]]
+AsyncSeqOp = Callable[[AsyncIterable[Any]], AsyncIterator[Any]]
 
 # Unions of Operators and Literals
 OptOp = Optional[AnyOp]
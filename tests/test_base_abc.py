@@ -70,3 +70,49 @@ class TestModule(test.ModuleTest):
         self.assertTrue(f() is f())
         self.assertTrue(f(1) is f(1))
         self.assertFalse(f(1) is f(2))
+
+        with self.subTest(isolated=False):
+            T = type('Multiton', (abc.Multiton, ), {'_isolated': False})
+            self.assertTrue(type(T(1)) is T)
+            self.assertFalse(type(f(1)) is f)
+
+        with self.subTest(registry='info'):
+            T = type('Multiton', (abc.Multiton, ), {})
+            T(1)
+            T(1)
+            T([])
+            self.assertEqual(T.get_registry_info(), (1, 2, None, 1))
+
+        with self.subTest(registry='maxsize'):
+            T = type('Multiton', (abc.Multiton, ), {})
+            T.set_registry_maxsize(2)
+            a = T(1)
+            T(2)
+            self.assertTrue(T(1) is a)
+            T(3)
+            self.assertTrue(T(1) is a)
+            self.assertEqual(T.get_registry_info().currsize, 2)
+            misses = T.get_registry_info().misses
+            T(2)
+            self.assertEqual(T.get_registry_info().misses, misses + 1)
+            with self.assertRaises(ValueError):
+                T.set_registry_maxsize(0)
+
+        with self.subTest(registry='maxsize', subclass=True):
+            T = type('Multiton', (abc.Multiton, ), {})
+            S = type('Multiton', (T, ), {})
+            for i in range(3):
+                S(i)
+            T.set_registry_maxsize(1)
+            self.assertEqual(S.get_registry_info().maxsize, 1)
+            self.assertEqual(S.get_registry_info().currsize, 1)
+
+        with self.subTest(registry='clear'):
+            T = type('Multiton', (abc.Multiton, ), {})
+            a = T(1)
+            T.clear_registry()
+            self.assertEqual(T.get_registry_info(), (0, 0, None, 0))
+            self.assertFalse(T(1) is a)
+
+    def test_RegistryInfo(self) -> None:
+        pass # Implicitly tested by test_Multiton()
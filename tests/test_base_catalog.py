@@ -36,6 +36,17 @@ class TestCatalog(test.ModuleTest):
     def test_Category(self) -> None:
         pass # Implicitly tested in test_category
 
+    def test_Statistic(self) -> None:
+        self.assertTrue(issubclass(catalog.Statistic, catalog.Category))
+        self.assertEqual(catalog.Statistic('mean').tags, ())
+
+        @catalog.register(catalog.Statistic, name='test_range')
+        def test_range(data: list) -> float:
+            return max(data) - min(data)
+
+        card = catalog.Manager().get(test_range)
+        self.assertEqual(card.data, {'name': 'test_range', 'tags': ()})
+
     def test_Results(self) -> None:
         @catalog.category
         class C:
@@ -24,8 +24,41 @@ __author__ = 'Frootlab Developers'
 __email__ = 'contact@frootlab.org'
 __authors__ = ['Patrick Michl <patrick.michl@frootlab.org>']
 
+import asyncio
+import concurrent.futures
+import functools
+import io
+import math
+import operator as py_operator
+import os
+import pickle
+import tempfile
 from unittest import mock
-from hup.base import test, operator
+from hup.base import test, operator, stype
+
+#
+# Helper Functions
+#
+
+async def _iterate(seq, pulled=None):
+    # Asynchronously iterate over a sequence and count the pulled objects
+    for obj in seq:
+        if pulled is not None:
+            pulled.append(obj)
+        await asyncio.sleep(0)
+        yield obj
+
+def _collect(aseq, limit=None):
+    # Collect the objects of an asynchronous iterator
+    async def collect():
+        objs = []
+        async for obj in aseq:
+            objs.append(obj)
+            if len(objs) == limit:
+                break
+        await aseq.aclose()
+        return objs
+    return asyncio.run(collect())
 
 #
 # Test Cases
@@ -178,6 +211,40 @@ class TestOperator(test.ModuleTest):
             f = F('a', 'b', target=dict)
             self.assertEqual(f(1, 2), {'a': 1, 'b': 2})
 
+        with self.subTest(batch=('x', 'z'), domain=(None, ('x', 'y', 'z'))):
+            f = F('x', 'z', domain=(None, ('x', 'y', 'z')))
+            self.assertEqual(f.batch([(1, 2, 3), (4, 5, 6)]), ([1, 4], [3, 6]))
+
+        with self.subTest(batch=('a', 'b'), domain=object, target=dict):
+            f = F('a', 'b', domain=object, target=dict)
+            self.assertEqual(f.batch([obj, obj]), {'a': [1, 1], 'b': [2, 2]})
+
+        with self.subTest(batch=('x', 'y'), domain=(tuple, ('x', 'y', 'z'))):
+            dom = (tuple, (('x', int), ('y', float), 'z'))
+            f = F('x', 'y', domain=dom, target=tuple)
+            x, y = f.batch(iter([(1, .5, 'a'), (2, 1.5, 'b')]))
+            self.assertEqual((x.typecode, x.tolist()), ('q', [1, 2]))
+            self.assertEqual((y.typecode, y.tolist()), ('d', [.5, 1.5]))
+            x, y = f.batch([(1, .5, 'a'), (2, 1.5, 'b')], typed=False)
+            self.assertEqual((x, y), ([1, 2], [.5, 1.5]))
+            x, y = f.batch([(None, .5, 'a'), (2**70, 1, 'b')])
+            self.assertEqual(x, [None, 2**70])
+            self.assertEqual((y.typecode, y.tolist()), ('d', [.5, 1.]))
+
+        with self.subTest(batch=('x', 'y'), target=set):
+            target = stype.create_domain((set, ('x', 'y')))
+            self.assertRaises(
+                ValueError, operator._format_columns, [[1], [2]], target)
+
+        with self.subTest(pickle=('x', 'z'), domain=(None, ('x', 'y', 'z'))):
+            f = F('x', 'z', domain=(None, ('x', 'y', 'z')))
+            self.assertIs(pickle.loads(pickle.dumps(f)), f)
+
+        with self.subTest(isolated=False):
+            f = F('x', 'z', domain=(None, ('x', 'y', 'z')))
+            self.assertIs(type(f), operator.Getter)
+            self.assertEqual(len(f), 2)
+
     def test_Lambda(self) -> None:
         create = operator.Lambda
 
@@ -237,6 +304,14 @@ class TestOperator(test.ModuleTest):
             self.assertEqual(int(op(2)), 4)
             self.assertEqual(int(op(2, 2)), 4)
 
+        with self.subTest(batch=('x**2 + y', )):
+            op = create('x**2 + y')
+            self.assertEqual(op.batch([(1, 2), (3, 4)]), [3, 13])
+
+        with self.subTest(pickle=('x**2 + y', )):
+            op = create('x**2 + y')
+            self.assertIs(pickle.loads(pickle.dumps(op)), op)
+
     def test_Vector(self) -> None:
         Op = operator.Vector
         obj = mock.Mock()
@@ -300,6 +375,145 @@ class TestOperator(test.ModuleTest):
             self.assertTrue(all(map(callable, f)))
             self.assertEqual(f.components, ('a', 'b', 'c', 'Y'))
 
+        with self.subTest(args=(('y', 'a**2 + b'), ('z', '(a**2 + b) * a'))):
+            f = Op(
+                ('y', 'a**2 + b', ('a', 'b')),
+                ('z', '(a**2 + b) * a', ('a', 'b')),
+                ('w', len, 'c'), domain=dict, target=list)
+            self.assertRaises(KeyError, f, dic)
+            self.assertEqual(f({'a': 2, 'b': 1, 'c': 'abc'}), [5, 10, 3])
+
+        with self.subTest(args=(('y', '{x} * y'), ('x', '{x}'))):
+            f = Op(
+                ('y', '{x} * y', ('{x}', 'y')), ('x', '{x}'),
+                domain=(None, ('y', '{x}')))
+            self.assertEqual(f(2, 3), (6, 3))
+
+        with self.subTest(batch=('a', ('y', 'a + b')), domain=dict):
+            f = Op('a', ('y', 'a + b', ('a', 'b')), domain=dict, target=dict)
+            self.assertEqual(
+                f.batch([dic, {'a': 3, 'b': 4}]), {'a': [1, 3], 'y': [3, 7]})
+
+        with self.subTest(pickle=('a', ('y', 'a + b')), domain=dict):
+            f = Op('a', ('y', 'a + b', ('a', 'b')), domain=dict, target=dict)
+            self.assertIs(pickle.loads(pickle.dumps(f)), f)
+
+        with self.subTest(args=('a', ('y', 'a + b')), target=set):
+            self.assertRaises(
+                ValueError, Op, 'a', ('y', 'a + b', ('a', 'b')), domain=dict,
+                target=set)
+
+    def test_InvertibleAccumulator(self) -> None:
+        values = [2., 4., 4., 4., 5., 5., 7., 9.]
+        for acc in [
+                operator.Count(), operator.Sum(), operator.Mean(),
+                operator.Variance()]:
+            with self.subTest(accumulator=acc):
+                state = functools.reduce(acc.update, values, acc.initialize())
+                state = functools.reduce(acc.remove, values[:3], state)
+                self.assertAlmostEqual(
+                    acc.finalize(state), acc(values[3:]))
+
+    def test_First(self) -> None:
+        acc = operator.First()
+        self.assertEqual(acc([3, 1, 2]), 3)
+        self.assertEqual(acc([]), None)
+        state = acc.merge(acc.initialize(), acc.update(acc.initialize(), 1))
+        self.assertEqual(acc.finalize(acc.update(state, 2)), 1)
+
+    def test_Count(self) -> None:
+        acc = operator.Count()
+        self.assertEqual(acc([3, 1, 2]), 3)
+        self.assertEqual(acc(iter([3, 1, 2])), 3)
+        self.assertEqual(acc.merge(acc.update(acc.initialize(), 1), 2), 3)
+
+    def test_Sum(self) -> None:
+        acc = operator.Sum()
+        self.assertEqual(acc([3, 1, 2]), 6)
+        self.assertEqual(acc([]), 0)
+        self.assertEqual(acc.merge(acc.update(acc.initialize(), 1), 2), 3)
+
+    def test_Min(self) -> None:
+        acc = operator.Min()
+        self.assertEqual(acc([3, 1, 2]), 1)
+        self.assertEqual(acc([]), None)
+        self.assertEqual(acc.merge(acc.initialize(), 2), 2)
+        self.assertEqual(acc.merge(1, acc.initialize()), 1)
+
+    def test_Max(self) -> None:
+        acc = operator.Max()
+        self.assertEqual(acc([3, 1, 2]), 3)
+        self.assertEqual(acc([]), None)
+        self.assertEqual(acc.merge(acc.initialize(), 2), 2)
+        self.assertEqual(acc.merge(3, acc.initialize()), 3)
+
+    def test_Mean(self) -> None:
+        acc = operator.Mean()
+        self.assertEqual(acc([3, 1, 2]), 2.)
+        self.assertNotEqual(acc([]), acc([]))
+        state = functools.reduce(acc.update, [3, 1], acc.initialize())
+        state = acc.merge(state, acc.update(acc.initialize(), 2))
+        self.assertEqual(acc.finalize(state), 2.)
+
+    def test_Variance(self) -> None:
+        values = [2., 4., 4., 4., 5., 5., 7., 9.]
+        with self.subTest(ddof=0):
+            acc = operator.Variance()
+            self.assertAlmostEqual(acc(values), 4.)
+            a = functools.reduce(acc.update, values[:3], acc.initialize())
+            b = functools.reduce(acc.update, values[3:], acc.initialize())
+            self.assertAlmostEqual(acc.finalize(acc.merge(a, b)), 4.)
+            self.assertNotEqual(acc([]), acc([]))
+        with self.subTest(ddof=1):
+            acc = operator.Variance(ddof=1)
+            self.assertAlmostEqual(acc(values), 32. / 7.)
+            self.assertNotEqual(acc([1.]), acc([1.]))
+
+    def test_HyperLogLog(self) -> None:
+        acc = operator.HyperLogLog()
+        values = [i % 1000 for i in range(5000)]
+        self.assertAlmostEqual(acc(values) / 1000, 1., delta=.05)
+        self.assertEqual(acc(['a', 'b', 'a']), 2)
+        self.assertEqual(acc([]), 0)
+        a = functools.reduce(acc.update, values[:2500], acc.initialize())
+        b = functools.reduce(
+            acc.update, range(1000, 2000), acc.initialize())
+        self.assertAlmostEqual(
+            acc.finalize(acc.merge(a, b)) / 2000, 1., delta=.05)
+        self.assertRaises(ValueError, operator.HyperLogLog, 20)
+
+        with self.subTest(values=(1, 1., True)):
+            self.assertEqual(acc([1, 1., True]), 1)
+            self.assertEqual(acc([1, '1']), 2)
+            self.assertRaises(ValueError, acc, [object()])
+
+        for precision in [4, 5, 6]:
+            with self.subTest(precision=precision):
+                acc = operator.HyperLogLog(precision)
+                error = 1.04 / math.sqrt(2 ** precision)
+                errors = [
+                    acc(range(i * 10000, i * 10000 + 2000)) / 2000 - 1.
+                    for i in range(40)]
+                self.assertLess(abs(sum(errors) / len(errors)), error)
+                self.assertLess(sum(map(abs, errors)) / len(errors), error)
+
+    def test_Quantile(self) -> None:
+        values = [(i * 7919) % 10000 for i in range(10000)]
+        with self.subTest(q=.5):
+            acc = operator.Quantile()
+            self.assertAlmostEqual(acc(values), 5000, delta=100)
+            self.assertEqual(acc([3, 1, 2]), 2)
+            self.assertNotEqual(acc([]), acc([]))
+            a = functools.reduce(acc.update, values[:5000], acc.initialize())
+            b = functools.reduce(acc.update, values[5000:], acc.initialize())
+            self.assertAlmostEqual(
+                acc.finalize(acc.merge(a, b)), 5000, delta=100)
+        with self.subTest(q=.9):
+            acc = operator.Quantile(.9)
+            self.assertAlmostEqual(acc(values), 9000, delta=100)
+        with self.subTest(q=2.):
+            self.assertRaises(ValueError, operator.Quantile, 2.)
+
     def test_create_setter(self) -> None:
         items = [('name', 'monty'), ('id', 42)]
 
@@ -334,6 +548,44 @@ class TestOperator(test.ModuleTest):
         sorter = operator.create_sorter('y', domain=object, reverse=True)
         self.assertEqual(list(map(getx, sorter(seq))), list(range(10)))
 
+        with self.subTest(limit=3):
+            sorter = operator.create_sorter('y', domain=object, limit=3)
+            self.assertEqual(list(map(getx, sorter(seq))), [9, 8, 7])
+            sorter = operator.create_sorter(
+                'y', domain=object, reverse=True, limit=3)
+            self.assertEqual(list(map(getx, sorter(iter(seq)))), [0, 1, 2])
+
+        with self.subTest(limit=3, stable=True):
+            rows = [(1, 'a'), (0, 'b'), (1, 'c'), (0, 'd')]
+            for reverse in [False, True]:
+                sorter = operator.create_sorter(
+                    'x', domain=(tuple, ('x', 'y')), reverse=reverse, limit=3)
+                full = operator.create_sorter(
+                    'x', domain=(tuple, ('x', 'y')), reverse=reverse)
+                self.assertEqual(sorter(rows), full(rows)[:3])
+
+        with self.subTest(limit=0):
+            sorter = operator.create_sorter(limit=0)
+            self.assertEqual(sorter([3, 1, 2]), [])
+            self.assertRaises(ValueError, operator.create_sorter, limit=-1)
+            for limit in [1.5, '1']:
+                self.assertRaises(
+                    TypeError, operator.create_sorter, limit=limit)
+
+        with self.subTest(buffer_size=2):
+            rows = [(i % 3, i) for i in range(10)]
+            for reverse in [False, True]:
+                sorter = operator.create_sorter(
+                    'x', domain=(tuple, ('x', 'y')), reverse=reverse,
+                    buffer_size=2)
+                full = operator.create_sorter(
+                    'x', domain=(tuple, ('x', 'y')), reverse=reverse)
+                self.assertEqual(list(sorter(iter(rows))), full(rows))
+            for buffer_size in [0, -1]:
+                self.assertRaises(
+                    ValueError, operator.create_sorter, 'x',
+                    domain=(tuple, ('x', 'y')), buffer_size=buffer_size)
+
     def test_create_aggregator(self) -> None:
         seq = list(mock.Mock() for i in range(10))
         for i, obj in enumerate(seq):
@@ -360,6 +612,32 @@ class TestOperator(test.ModuleTest):
                 {'bool': False, 'count': 6, 'max(id)': 5},
                 {'bool': True, 'count': 4, 'max(id)': 9}])
 
+        args = (
+            'bool', ('count', operator.Count(), 'bool'),
+            ('max(id)', operator.Max(), 'id'),
+            ('var(id)', operator.Variance(), 'id'))
+        with self.subTest(args=args, domain=object):
+            aggregate = operator.create_aggregator(*args, domain=object)
+            self.assertEqual(aggregate(iter(seq)), (False, 10, 9, 8.25))
+
+        with self.subTest(domain=(tuple, (('x', int), ('y', float)))):
+            dom = (tuple, (('x', int), ('y', float)))
+            rows = [(1, 2.), (None, 3.), (2**70, 1)]
+            aggregate = operator.create_aggregator(
+                ('x', len, 'x'), ('y', max, 'y'), domain=dom)
+            self.assertEqual(aggregate(rows), (3, 3.))
+            aggregate = operator.create_aggregator(
+                ('x', type, 'x'), ('y', type, 'y'), domain=dom)
+            self.assertEqual(aggregate(rows[:1]), (list, list))
+            select = operator.create_filter('y > 1.5', domain=dom)
+            self.assertEqual(list(select(rows)), rows[:2])
+
+        with self.subTest(args=('max(id)', )):
+            for func in [operator.Max(), max]:
+                aggregate = operator.create_aggregator(
+                    ('max(id)', func, 'id'), domain=object)
+                self.assertEqual(aggregate(seq), 9)
+
     def test_create_group_aggregator(self) -> None:
         with self.subTest(domain=object):
             objseq = list(mock.Mock() for i in range(15))
@@ -378,6 +656,89 @@ class TestOperator(test.ModuleTest):
                     list(op(objseq)), [
                     {'bool': False, 'count': 6, 'max(id)': 5},
                     {'bool': True, 'count': 9, 'max(id)': 14}])
+            with self.subTest(args=args, key='bool', hashed=True):
+                op = operator.create_group_aggregator(
+                    *args, key='bool', domain=object, hashed=True)
+                self.assertEqual(
+                    list(op(objseq[::-1])), [(True, 9, 14), (False, 6, 5)])
+
+        with self.subTest(accumulators=True):
+            seq = [{'g': i % 3, 'x': float(i)} for i in range(9)]
+            args = (
+                'g', ('n', operator.Count(), 'x'), ('s', operator.Sum(), 'x'),
+                ('m', operator.Mean(), 'x'), ('max', operator.Max(), 'x'))
+            expect = [(0, 3, 9., 3., 6.), (1, 3, 12., 4., 7.),
+                (2, 3, 15., 5., 8.)]
+            for kwds in [{}, {'hashed': True}, {'buffer_size': 2}]:
+                with self.subTest(**kwds):
+                    op = operator.create_group_aggregator(
+                        *args, key='g', domain=dict, **kwds)
+                    self.assertEqual(list(op(iter(seq))), expect)
+            op = operator.create_group_aggregator(
+                *args, key='g', domain=dict, presorted=True, target=dict)
+            result = list(op(sorted(seq, key=lambda obj: obj['g'])))
+            self.assertEqual(
+                result[0], {'g': 0, 'n': 3, 's': 9., 'm': 3., 'max': 6.})
+
+        with self.subTest(sketches=True):
+            seq = [{'g': i % 2, 'x': i % 10} for i in range(100)]
+            args = (
+                'g', ('d', operator.HyperLogLog(), 'x'),
+                ('m', operator.Quantile(), 'x'))
+            op = operator.create_group_aggregator(*args, key='g', domain=dict)
+            self.assertEqual(list(op(seq)), [(0, 5, 4), (1, 5, 5)])
+
+        with self.subTest(workers=2):
+            seq = [{'g': (7 * i) % 4, 'x': float(i)} for i in range(20)]
+            for args in [
+                    ('g', ('n', operator.Count(), 'x'),
+                     ('s', operator.Sum(), 'x')),
+                    ('g', ('n', len, 'x'), ('s', sum, 'x'))]:
+                for kwds in [{}, {'hashed': True}]:
+                    serial = operator.create_group_aggregator(
+                        *args, key='g', domain=dict, **kwds)
+                    parallel = operator.create_group_aggregator(
+                        *args, key='g', domain=dict, workers=2, **kwds)
+                    self.assertEqual(list(parallel(seq)), list(serial(seq)))
+            for kwds in [{'buffer_size': 2}, {'max_groups': 2}]:
+                self.assertRaises(
+                    ValueError, operator.create_group_aggregator,
+                    ('n', operator.Count(), 'x'), key='g', domain=dict,
+                    workers=2, **kwds)
+
+        with self.subTest(args=('g', )):
+            seq = [{'g': i % 2, 'x': i} for i in range(4)]
+            for kwds in [{}, {'hashed': True}, {'workers': 2}]:
+                op = operator.create_group_aggregator(
+                    'g', key='g', domain=dict, **kwds)
+                self.assertEqual(list(op(seq)), [0, 1])
+            for func in [operator.Sum(), sum]:
+                op = operator.create_group_aggregator(
+                    ('s', func, 'x'), key='g', domain=dict)
+                self.assertEqual(list(op(seq)), [2, 4])
+
+        with self.subTest(buffer_size=0):
+            for args in [('g', ('n', operator.Count(), 'x')), ('g', 'x')]:
+                for buffer_size in [0, -1]:
+                    self.assertRaises(
+                        ValueError, operator.create_group_aggregator, *args,
+                        key='g', domain=dict, buffer_size=buffer_size)
+
+        with self.subTest(max_groups=2):
+            seq = [{'g': (7 * i) % 50, 'x': i} for i in range(500)]
+            args = (
+                'g', ('n', operator.Count(), 'x'), ('s', operator.Sum(), 'x'))
+            serial = operator.create_group_aggregator(
+                *args, key='g', domain=dict, hashed=True)
+            for max_groups in [2, 10, 100]:
+                spilled = operator.create_group_aggregator(
+                    *args, key='g', domain=dict, hashed=True,
+                    max_groups=max_groups)
+                self.assertEqual(list(spilled(iter(seq))), list(serial(seq)))
+            for max_groups in [0, -1]:
+                self.assertRaises(
+                    ValueError, operator.create_group_aggregator, *args,
+                    key='g', domain=dict, hashed=True, max_groups=max_groups)
 
     def test_create_grouper(self) -> None:
         seq = list(mock.Mock() for i in range(10))
@@ -400,6 +761,31 @@ class TestOperator(test.ModuleTest):
             self.assertEqual(len(grouper(seq)), 2)
             self.assertEqual(len(grouper(seq)[0]), 6)
 
+        with self.subTest(args=('name', ), domain=object, hashed=True):
+            grouper = operator.create_grouper(
+                'name', domain=object, hashed=True)
+            groups = grouper(seq[::-1])
+            self.assertEqual(len(groups), 2)
+            self.assertEqual(len(groups[0]), 4)
+            self.assertEqual(groups[1][0].id, 5)
+
+        with self.subTest(presorted=True, hashed=True):
+            self.assertRaises(
+                ValueError, operator.create_grouper, 'name', domain=object,
+                presorted=True, hashed=True)
+
+        with self.subTest(args=('x', ), buffer_size=3):
+            rows = [(i % 3, i) for i in range(10)]
+            grouper = operator.create_grouper(
+                'x', domain=(tuple, ('x', 'y')), buffer_size=3)
+            groups = list(grouper(iter(rows)))
+            self.assertEqual(len(groups), 3)
+            self.assertEqual(groups[0], [(0, 0), (0, 3), (0, 6), (0, 9)])
+            for buffer_size in [0, -1]:
+                self.assertRaises(
+                    ValueError, operator.create_grouper, 'x',
+                    domain=(tuple, ('x', 'y')), buffer_size=buffer_size)
+
         with self.subTest(args=('id', )):
             grouper = operator.create_grouper('id', domain=object)
             self.assertEqual(len(grouper(seq)), 10)
@@ -426,3 +812,475 @@ class TestOperator(test.ModuleTest):
         with self.subTest(args=(lambda x: x + 1, lambda x: x - 1)):
             op = operator.compose(lambda x: x + 1, lambda x: x - 1)
             self.assertEqual(op(1), 1)
+
+        with self.subTest(args=('itemgetter', 'attrgetter')):
+            op = operator.compose(
+                py_operator.attrgetter('real'), py_operator.itemgetter(0),
+                py_operator.itemgetter(1))
+            self.assertEqual(op([0, [2, 3]]), 2)
+
+        with self.subTest(unpack=True):
+            swap = operator.Getter('y', 'x', domain=(None, ('x', 'y')))
+            op = operator.compose(swap, swap, swap, unpack=True)
+            self.assertEqual(op(1, 2), (2, 1))
+
+    def test_parallel_map(self) -> None:
+        op = operator.Lambda('x**2', variables=('x', ))
+        seq = list(range(10))
+        with self.subTest(workers=2):
+            self.assertEqual(
+                operator.parallel_map(op, seq, workers=2), list(map(op, seq)))
+        with self.subTest(workers=2, chunksize=3):
+            self.assertEqual(
+                operator.parallel_map(op, iter(seq), workers=2, chunksize=3),
+                list(map(op, seq)))
+
+    def test_create_pivot(self) -> None:
+        dom = (tuple, ('r', 'c', 'v'))
+        seq = [(i % 2, 'abc'[i % 3], i) for i in range(10)]
+
+        with self.subTest(aggfunc=None):
+            op = operator.create_pivot('r', 'c', 'v', domain=dom)
+            self.assertEqual(op(seq), {
+                0: {'a': 2, 'b': 1, 'c': 2}, 1: {'a': 2, 'b': 2, 'c': 1}})
+            self.assertEqual(list(op(seq)[1]), ['a', 'b', 'c'])
+
+        with self.subTest(aggfunc=operator.Sum()):
+            op = operator.create_pivot(
+                'r', 'c', 'v', operator.Sum(), domain=dom)
+            self.assertEqual(op(iter(seq)), {
+                0: {'a': 6, 'b': 4, 'c': 10}, 1: {'a': 12, 'b': 8, 'c': 5}})
+
+        with self.subTest(aggfunc=max, fill=0):
+            op = operator.create_pivot('r', 'c', 'v', max, domain=dom, fill=0)
+            self.assertEqual(op(seq[:3]), {
+                0: {'a': 0, 'b': 0, 'c': 2}, 1: {'a': 0, 'b': 1, 'c': 0}})
+
+        with self.subTest(row=('r', 'c')):
+            op = operator.create_pivot(('r', 'c'), 'r', 'v', domain=dom)
+            self.assertEqual(op(seq[:2]), {
+                (0, 'a'): {0: 1, 1: None}, (1, 'b'): {0: None, 1: 1}})
+
+    def test_create_rollup(self) -> None:
+        seq = [{'a': 'xy'[i % 2], 'b': i % 3, 'v': i} for i in range(12)]
+
+        with self.subTest(accumulation=True):
+            op = operator.create_rollup(
+                'a', 'b', ('n', operator.Count(), 'v'),
+                ('s', operator.Sum(), 'v'), keys=('a', 'b'), domain=dict)
+            self.assertEqual(list(op(iter(seq))), [
+                ('x', 0, 2, 6), ('x', 2, 2, 10), ('x', 1, 2, 14),
+                ('x', None, 6, 30), ('y', 1, 2, 8), ('y', 0, 2, 12),
+                ('y', 2, 2, 16), ('y', None, 6, 36), (None, None, 12, 66)])
+            self.assertEqual(list(op([])), [])
+
+        with self.subTest(accumulation=False):
+            op = operator.create_rollup(
+                'a', ('s', sum, 'v'), keys=('a', 'b'), domain=dict,
+                target=dict)
+            result = list(op(seq))
+            self.assertEqual(len(result), 9)
+            self.assertEqual(result[3], {'a': 'x', 's': 30})
+            self.assertEqual(result[-1], {'a': None, 's': 66})
+
+        with self.subTest(keys=()):
+            self.assertRaises(
+                ValueError, operator.create_rollup, 'v', keys=(), domain=dict)
+
+    def test_create_join(self) -> None:
+        left = [(1, 'a'), (2, 'b'), (2, 'c'), (4, 'd')]
+        right = [{'id': 2, 'v': 'x'}, {'id': 3, 'v': 'y'}, {'id': 1, 'v': 'z'}]
+        dom = (tuple, ('id', 'name'))
+        l1, l2, l3, l4 = left
+        r2, r3, r1 = right
+
+        with self.subTest(how='inner'):
+            join = operator.create_join('id', domain=dom, right_domain=dict)
+            self.assertEqual(
+                list(join(left, right)), [(l1, r1), (l2, r2), (l3, r2)])
+
+        with self.subTest(how='left'):
+            join = operator.create_join(
+                'id', how='left', domain=dom, right_domain=dict)
+            self.assertEqual(
+                list(join(left, right)),
+                [(l1, r1), (l2, r2), (l3, r2), (l4, None)])
+
+        with self.subTest(how='outer'):
+            join = operator.create_join(
+                'id', how='outer', domain=dom, right_domain=dict)
+            self.assertEqual(
+                list(join(iter(left), iter(right))),
+                [(l1, r1), (l2, r2), (l3, r2), (l4, None), (None, r3)])
+
+        with self.subTest(how='outer', presorted=True):
+            join = operator.create_join(
+                'id', how='outer', domain=dom, right_domain=dict,
+                presorted=True)
+            rseq = [r1, r2, r3]
+            self.assertEqual(
+                list(join(iter(left), iter(rseq))),
+                [(l1, r1), (l2, r2), (l3, r2), (None, r3), (l4, None)])
+
+        with self.subTest(how='inner', presorted=True, target=dict):
+            join = operator.create_join(
+                'id', domain=dom, right_domain=dict, target=dict,
+                presorted=True)
+            self.assertEqual(
+                list(join(left, [r1, r3])), [{'left': l1, 'right': r1}])
+
+        with self.subTest(how='cross'):
+            self.assertRaises(
+                ValueError, operator.create_join, 'id', how='cross')
+
+    def test_create_filter(self) -> None:
+        seq = [{'x': i, 'y': i % 3} for i in range(10)]
+
+        with self.subTest(args=('x > 5 and y == 0', ), domain=dict):
+            op = operator.create_filter('x > 5 and y == 0', domain=dict)
+            self.assertEqual(list(op(seq)), [seq[6], seq[9]])
+            self.assertEqual(list(op(iter(seq))), [seq[6], seq[9]])
+
+        with self.subTest(args=('x > y', ), domain=(None, ('x', 'y'))):
+            op = operator.create_filter('x > y', domain=(None, ('x', 'y')))
+            self.assertEqual(list(op([(1, 2), (3, 2)])), [(3, 2)])
+
+        with self.subTest(args=('real > 1', ), domain=object, mask=True):
+            op = operator.create_filter('real > 1', domain=object, mask=True)
+            self.assertEqual(op(iter([1, 2, 3])), [False, True, True])
+
+        with self.subTest(args=('1 > 0', ), domain=dict):
+            op = operator.create_filter('1 > 0', domain=dict)
+            self.assertEqual(list(op(iter(seq))), seq)
+            op = operator.create_filter('1 > 0', domain=dict, mask=True)
+            self.assertEqual(op(seq), [True] * 10)
+            op = operator.create_filter('1 < 0', domain=dict)
+            self.assertEqual(list(op(seq)), [])
+            op = operator.create_filter('1 < 0', domain=dict, mask=True)
+            self.assertEqual(op(iter(seq)), [False] * 10)
+
+    def test_create_distinct(self) -> None:
+        seq = [(i % 4, i) for i in range(12)]
+
+        with self.subTest(args=('x', ), domain=(tuple, ('x', 'y'))):
+            op = operator.create_distinct('x', domain=(tuple, ('x', 'y')))
+            self.assertEqual(list(op(iter(seq))), seq[:4])
+
+        with self.subTest(args=tuple()):
+            op = operator.create_distinct()
+            self.assertEqual(list(op([1, 2, 1, 3, 2])), [1, 2, 3])
+
+        with self.subTest(approximate=True):
+            op = operator.create_distinct(
+                'x', domain=(tuple, ('x', 'y')), approximate=True,
+                capacity=100, error_rate=.01)
+            self.assertEqual(list(op(seq)), seq[:4])
+            op = operator.create_distinct(
+                approximate=True, capacity=1000, error_rate=.01)
+            self.assertGreater(len(list(op(range(1000)))), 950)
+
+        with self.subTest(approximate=True, error_rate=.001):
+            bloom = operator._BloomFilter(10000, .001)
+            for key in range(10000):
+                bloom.add(key)
+            self.assertTrue(all(key in bloom for key in range(10000)))
+            probes = range(10 ** 6, 10 ** 6 + 100000)
+            rate = sum(key in bloom for key in probes) / len(probes)
+            self.assertLess(rate, .0015)
+
+    def test_GroupAggregator(self) -> None:
+        dom = (tuple, ('k', 'v'))
+        args = ('k', ('n', operator.Count(), 'v'), ('m', operator.Mean(), 'v'))
+
+        with self.subTest(method='append'):
+            aggregator = operator.GroupAggregator(*args, key='k', domain=dom)
+            self.assertEqual(
+                aggregator.append([('a', 1), ('b', 2), ('a', 3)]),
+                [('a', 2, 2.), ('b', 1, 2.)])
+            self.assertEqual(
+                aggregator.append(iter([('b', 4)])), [('b', 2, 3.)])
+            self.assertEqual(
+                list(aggregator), [('a', 2, 2.), ('b', 2, 3.)])
+            self.assertEqual(len(aggregator), 2)
+
+        with self.subTest(method='save'):
+            file = io.BytesIO()
+            aggregator.save(file)
+            file.seek(0)
+            restored = operator.GroupAggregator(*args, key='k', domain=dom)
+            restored.load(file)
+            self.assertEqual(list(restored), list(aggregator))
+            restored.append([('c', 5)])
+            self.assertEqual(len(restored), 3)
+            self.assertEqual(len(aggregator), 2)
+            file.seek(0)
+            other = operator.GroupAggregator(('n', operator.Count(), 'v'))
+            self.assertRaises(ValueError, other.load, file)
+            for kwds in [{'key': 'v', 'domain': dom}, {'key': 'k'}]:
+                file.seek(0)
+                other = operator.GroupAggregator(*args, **kwds)
+                self.assertRaises(ValueError, other.load, file)
+
+        with self.subTest(method='save', file='path'):
+            with tempfile.TemporaryDirectory() as dirname:
+                path = os.path.join(dirname, 'aggregates.pkl')
+                aggregator.save(path)
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = os.stat(path).st_mode & 0o777
+                self.assertEqual(mode, 0o666 & ~umask)
+                os.chmod(path, 0o600)
+                aggregator.save(path)
+                self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+                restored = operator.GroupAggregator(
+                    *args, key='k', domain=dom)
+                restored.load(path)
+                self.assertEqual(list(restored), list(aggregator))
+                failing = operator.GroupAggregator(
+                    ('f', operator.First(), 'v'), key='k', domain=dom)
+                failing.append([('a', lambda: None)])
+                self.assertRaises(
+                    Exception, failing.save, os.path.join(dirname, 'f.pkl'))
+                self.assertEqual(os.listdir(dirname), ['aggregates.pkl'])
+
+        with self.subTest(key=None):
+            aggregator = operator.GroupAggregator(
+                ('s', operator.Sum(), 'v'), domain=dom)
+            aggregator.append([('a', 1), ('b', 2)])
+            self.assertEqual(aggregator.append([('a', 3)]), [6])
+
+        with self.subTest(aggfunc=max):
+            self.assertRaises(
+                ValueError, operator.GroupAggregator, ('m', max, 'v'))
+
+    def test_create_window_aggregator(self) -> None:
+        seq = [{'g': i // 5, 'x': float(i % 5)} for i in range(10)]
+
+        with self.subTest(size=3):
+            args = (
+                ('s', operator.Sum(), 'x'), ('m', operator.Mean(), 'x'),
+                ('min', operator.Min(), 'x'), ('max', operator.Max(), 'x'))
+            op = operator.create_window_aggregator(
+                *args, size=3, domain=dict)
+            result = list(op(iter(seq)))
+            self.assertEqual(len(result), 8)
+            self.assertEqual(result[0], (3., 1., 0., 2.))
+            self.assertEqual(result[3], (7., 7. / 3., 0., 4.))
+
+        with self.subTest(size=2, step=2, key='g', target=dict):
+            args = ('g', ('n', len, 'x'), ('f', operator.First(), 'x'))
+            op = operator.create_window_aggregator(
+                *args, size=2, step=2, key='g', domain=dict, target=dict)
+            self.assertEqual(list(op(seq)), [
+                {'g': 0, 'n': 2, 'f': 0.}, {'g': 0, 'n': 2, 'f': 2.},
+                {'g': 1, 'n': 2, 'f': 0.}, {'g': 1, 'n': 2, 'f': 2.}])
+
+        with self.subTest(size=0):
+            self.assertRaises(
+                ValueError, operator.create_window_aggregator, 'x', size=0)
+
+        with self.subTest(args=('s', sum, 'x'), target=tuple):
+            args = ('s', sum, 'x')
+            window = operator.create_window_aggregator(
+                args, size=len(seq), domain=(dict, tuple))
+            aggregate = operator.create_aggregator(args, domain=(dict, tuple))
+            self.assertEqual(list(window(seq)), [aggregate(seq)])
+            self.assertEqual(list(window(seq)), [20.])
+
+    def test_CacheInfo(self) -> None:
+        pass # Implicitly tested by test_create_memoizer()
+
+    def test_create_memoizer(self) -> None:
+        with self.subTest(op=operator.Lambda('x**2 + y'), maxsize=2):
+            op = operator.create_memoizer(
+                operator.Lambda('x**2 + y'), maxsize=2)
+            self.assertEqual([op(1, 2), op(1, 2), op(2, 3)], [3, 3, 7])
+            self.assertEqual(op(3, 3), 12)
+            self.assertEqual(op(1, 2), 3)
+            self.assertEqual(op.cache_info(), (1, 4, 2, 2))
+            op.cache_clear()
+            self.assertEqual(op.cache_info(), (0, 0, 2, 0))
+
+        with self.subTest(key='country', domain=dict):
+            func = mock.Mock(side_effect=lambda obj: obj['country'].upper())
+            op = operator.create_memoizer(func, key='country', domain=dict)
+            seq = [{'country': c, 'id': i} for i, c in enumerate('abab')]
+            self.assertEqual(list(map(op, seq)), ['A', 'B', 'A', 'B'])
+            self.assertEqual(func.call_count, 2)
+            self.assertEqual(op.cache_info().hits, 2)
+
+        with self.subTest(op=len):
+            op = operator.create_memoizer(len, maxsize=None)
+            self.assertEqual([op('ab'), op('ab')], [2, 2])
+            self.assertEqual(op.cache_info(), (1, 1, None, 1))
+
+    def test_Pipeline(self) -> None:
+        rows = [{'k': 'abc'[i % 3], 'x': i, 'y': i % 4} for i in range(10)]
+        pipeline = operator.Pipeline(domain=dict)
+
+        with self.subTest(stages=('where', 'select', 'where')):
+            query = pipeline.where('x > 2').select(
+                'k', ('z', 'x + y', ('x', 'y'))).where('z < 10')
+            self.assertEqual(list(query(iter(rows))), [
+                ('a', 6), ('b', 4), ('c', 6), ('a', 8), ('c', 8)])
+            self.assertEqual(list(pipeline(rows)), rows)
+
+        with self.subTest(stages=('groupby', 'agg', 'orderby')):
+            query = pipeline.groupby('k').agg(
+                'k', ('n', operator.Count(), 'x'), ('s', max, 'x'))
+            self.assertEqual(
+                list(query.orderby('k')(rows)),
+                [('a', 4, 9), ('b', 3, 7), ('c', 3, 8)])
+            self.assertEqual(
+                list(query.orderby('s', reverse=True).limit(2)(rows)),
+                [('a', 4, 9), ('c', 3, 8)])
+            self.assertEqual(
+                list(query.where('n > 3')(rows)), [('a', 4, 9)])
+
+        with self.subTest(stages=('agg', )):
+            query = pipeline.agg(('s', operator.Sum(), 'x'))
+            self.assertEqual(list(query(rows)), [45])
+            query = pipeline.groupby('k').agg('k').where('k != "b"')
+            self.assertEqual(list(query(rows)), ['a', 'c'])
+
+        with self.subTest(target=dict):
+            query = operator.Pipeline(domain=dict, target=dict).select(
+                'x').where('x > 7').limit(1)
+            self.assertEqual(list(query(rows)), [{'x': 8}])
+
+        with self.subTest(stages=('groupby', )):
+            query = pipeline.groupby('k').limit(1)
+            self.assertRaises(ValueError, query, rows)
+
+    def test_Index(self) -> None:
+        pass # Implicitly tested by test_HashIndex() and test_SortedIndex()
+
+    def test_HashIndex(self) -> None:
+        index = operator.HashIndex('k', 'v', domain=dict)
+        index.update({'k': i % 2, 'v': i % 3} for i in range(6))
+        self.assertEqual(len(index), 6)
+        self.assertIn((1, 0), index)
+        self.assertEqual(index.get((1, 0)), [{'k': 1, 'v': 0}])
+        index.insert({'k': 1, 'v': 0, 'w': 1})
+        self.assertEqual(len(index.get((1, 0))), 2)
+        self.assertEqual(index.get((2, 0)), [])
+
+    def test_SortedIndex(self) -> None:
+        index = operator.SortedIndex('k', domain=(tuple, ('k', 'v')))
+        index.update((i % 3, i) for i in range(6))
+        index.insert((1, 6))
+        self.assertEqual(len(index), 7)
+        self.assertIn(2, index)
+        self.assertNotIn(3, index)
+        self.assertEqual(index.get(1), [(1, 1), (1, 4), (1, 6)])
+        self.assertEqual(index.between(2), [(2, 2), (2, 5)])
+        self.assertEqual(index.between(upper=0), [(0, 0), (0, 3)])
+        self.assertEqual(len(index.between(0, 1)), 5)
+
+    def test_create_index(self) -> None:
+        seq = [(i % 3, i) for i in range(6)]
+        dom = (tuple, ('k', 'v'))
+
+        with self.subTest(kind='hash'):
+            index = operator.create_index(seq, 'k', domain=dom)
+            self.assertIsInstance(index, operator.HashIndex)
+            self.assertEqual(index.get(1), [(1, 1), (1, 4)])
+
+        with self.subTest(kind='sorted'):
+            index = operator.create_index(
+                iter(seq), 'k', kind='sorted', domain=dom)
+            self.assertIsInstance(index, operator.SortedIndex)
+            self.assertEqual(
+                index.between(1, 2), [(1, 1), (1, 4), (2, 2), (2, 5)])
+
+        with self.subTest(kind='btree'):
+            self.assertRaises(
+                ValueError, operator.create_index, seq, 'k', kind='btree',
+                domain=dom)
+
+    def test_create_sampler(self) -> None:
+        with self.subTest(n=3):
+            op = operator.create_sampler(3, seed=1)
+            sample = op(iter(range(100)))
+            self.assertEqual(len(sample), 3)
+            self.assertTrue(set(sample) <= set(range(100)))
+            self.assertEqual(op(range(100)), sample)
+            self.assertEqual(op(range(2)), [0, 1])
+
+        with self.subTest(n=2, key='k'):
+            op = operator.create_sampler(
+                2, key='k', domain=(tuple, ('k', 'v')), seed=1)
+            samples = op((i % 3, i) for i in range(30))
+            self.assertEqual(len(samples), 3)
+            for k, sample in enumerate(samples):
+                self.assertEqual(len(sample), 2)
+                self.assertTrue(all(obj[0] == k for obj in sample))
+
+    def test_create_async_filter(self) -> None:
+        dom = (tuple, ('k', 'v'))
+        seq = [('ab'[i // 5], i) for i in range(10)]
+        op = operator.create_async_filter('v > 6', domain=dom)
+        self.assertEqual(
+            _collect(op(_iterate(seq))), [('b', 7), ('b', 8), ('b', 9)])
+
+    def test_create_async_mapper(self) -> None:
+        dom = (tuple, ('k', 'v'))
+        seq = [('ab'[i // 5], i) for i in range(10)]
+        op = operator.Lambda('v * v', domain=dom)
+        expect = [i * i for i in range(10)]
+
+        with self.subTest(executor=None):
+            mapper = operator.create_async_mapper(op)
+            self.assertEqual(_collect(mapper(_iterate(seq))), expect)
+
+        with self.subTest(executor='thread'):
+            with concurrent.futures.ThreadPoolExecutor(2) as executor:
+                mapper = operator.create_async_mapper(
+                    op, executor=executor, chunksize=3, max_pending=2)
+                self.assertEqual(_collect(mapper(_iterate(seq))), expect)
+                pulled: list = []
+                self.assertEqual(
+                    _collect(mapper(_iterate(seq, pulled)), limit=1), [0])
+                self.assertLessEqual(len(pulled), 7)
+
+    def test_create_async_group_aggregator(self) -> None:
+        dom = (tuple, ('k', 'v'))
+        seq = [('ab'[i // 5], i) for i in range(10)]
+
+        with self.subTest(presorted=False):
+            op = operator.create_async_group_aggregator(
+                'k', ('n', operator.Count(), 'v'), ('s', operator.Sum(), 'v'),
+                key='k', domain=dom)
+            self.assertEqual(
+                _collect(op(_iterate(seq))), [('a', 5, 10), ('b', 5, 35)])
+
+        with self.subTest(presorted=True):
+            op = operator.create_async_group_aggregator(
+                'k', ('s', sum, 'v'), key='k', domain=dom, presorted=True,
+                target=dict)
+            self.assertEqual(
+                _collect(op(_iterate(seq)), limit=1), [{'k': 'a', 's': 10}])
+
+        with self.subTest(key=None):
+            op = operator.create_async_group_aggregator(
+                ('s', operator.Sum(), 'v'), domain=dom)
+            self.assertEqual(_collect(op(_iterate(seq))), [45])
+
+    def test_create_async_window_aggregator(self) -> None:
+        dom = (tuple, ('k', 'v'))
+        seq = [('ab'[i // 5], i) for i in range(10)]
+        args = (('s', operator.Sum(), 'v'), ('m', operator.Max(), 'v'))
+        for key in [None, 'k']:
+            with self.subTest(key=key):
+                op = operator.create_async_window_aggregator(
+                    *args, size=3, step=2, key=key, domain=dom)
+                expect = operator.create_window_aggregator(
+                    *args, size=3, step=2, key=key, domain=dom)(seq)
+                self.assertEqual(_collect(op(_iterate(seq))), list(expect))
+
+        with self.subTest(args=('s', sum, 'v'), target=tuple):
+            args = (('s', sum, 'v'), )
+            op = operator.create_async_window_aggregator(
+                *args, size=10, domain=dom)
+            expect = operator.create_aggregator(*args, domain=dom)(seq)
+            self.assertEqual(_collect(op(_iterate(seq))), [expect])